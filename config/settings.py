@@ -1,11 +1,14 @@
 import os
+from functools import lru_cache
 from pydantic import Field
-from pydantic_settings import BaseSettings
-from typing import List
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import List, Optional
 from dotenv import load_dotenv
 
 load_dotenv()
 class Settings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", extra="allow")
+
     app_name: str = "Stock Market API"
     app_version: str = "1.0.0"
     debug: bool = True
@@ -23,6 +26,14 @@ class Settings(BaseSettings):
     
     # Cache settings
     cache_timeout: int = 300  # 5 minutes
+    price_cache_ttl: int = 60  # price history and the market responses built from it
+    cache_max_entries: int = 10_000  # in-process cache size per StockService
+    negative_cache_ttl: int = 60  # seconds to remember symbols Yahoo had no data for
+    info_retention_seconds: int = 86_400  # how long accepted company info backs sparse or failed refreshes
+    redis_url: Optional[str] = None  # e.g. redis://localhost:6379/0; in-process cache when unset
+
+    # Startup settings
+    preload_warmup: bool = False  # prime yfinance with a dummy fetch on startup
     
     
     SECRET_TOTP: str = Field(..., description="TOTP secret for 2FA")
@@ -33,12 +44,13 @@ class Settings(BaseSettings):
     IMET: str = Field(..., description="Device IMEI")
     DHAN_ACCESS_TOKEN: str = Field(..., description="Dhan access token")
     CLIENT_ID: str = Field(..., description="Dhan client ID")
-    
-    class Config:
-        env_file = ".env"
-        extra ="allow"
 
-settings = Settings()
+
+@lru_cache
+def get_settings() -> Settings:
+    return Settings()
+
+settings = get_settings()
 
 
 AZURE_CONFIG = {
@@ -1,50 +1,34 @@
-from fastapi import APIRouter, HTTPException, Query
-from services.ai_pdf_agents_service import (
-    PDFDownloaderService,
-    CloudUploaderService,
-    DocumentAnalyzerService,
-    LLMSummarizerService,
-)
+import asyncio
+from fastapi import APIRouter, HTTPException, Query, Request
 
 
 router = APIRouter(prefix="/ai", tags=["AI Document Intelligence"])
 
-# Initialize services
-downloader = PDFDownloaderService()
-uploader = CloudUploaderService()
-analyzer = DocumentAnalyzerService()
-summarizer = LLMSummarizerService()
-
 
 @router.get("/summarize")
 async def summarize_document(
+    request: Request,
     url: str = Query(
         ..., description="URL of the PDF document to process and summarize"
-    )
+    ),
 ):
     """
     📄 Uploads, analyzes, and summarizes a PDF document from a given URL.
     """
+    services = request.app.state.services
     try:
-        # Step 1: Download PDF
-        file_path = downloader.download(url)
-
-        # Step 2: Upload to Azure Blob & generate SAS URL
-        cloud_url = uploader.upload(file_path)
-
-        # Step 3: Analyze content using Azure Document Intelligence
-        analyzed_text = analyzer.analyze(cloud_url)
-
-        # Cleanup local file
-        import os
+        # Step 1: Stream PDF into Azure Blob & generate SAS URL
+        cloud_url = await services.ingestor.ingest(url)
 
-        if os.path.exists(file_path):
-            os.remove(file_path)
+        # Step 2: Analyze content using Azure Document Intelligence
+        analyzed_text = await asyncio.to_thread(services.analyzer.analyze, cloud_url)
 
-        # Step 4: Summarize content using Groq + Agno
+        # Step 3: Summarize content using Groq + Agno
         if analyzed_text:
             return {
-                "summary": summarizer.summarize(analyzed_text),
+                "summary": await asyncio.to_thread(
+                    services.summarizer.summarize, analyzed_text
+                ),
                 "source": url,
                 "status": "success",
             }
@@ -53,5 +37,7 @@ async def summarize_document(
             status_code=400, detail="No readable content found in document."
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 
 from models.schemas import TokenResponse
 from services.auth_service import AzureAuthService
@@ -7,9 +7,9 @@ azure_auth = AzureAuthService()
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
 @router.get("/token", response_model=TokenResponse)
-async def get_token():
+async def get_token(request: Request):
     """Get Azure AD access token"""
-    token = await azure_auth.get_access_token()
+    token = await azure_auth.get_access_token(request.app.state.http)
     if not token:
         raise HTTPException(
             status_code=500,
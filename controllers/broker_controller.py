@@ -1,12 +1,18 @@
+from functools import lru_cache
+from typing import Annotated
 from fastapi import APIRouter, Depends
+from controllers.stock_controller import get_stock_service
 from services.broker_service import BrokerService
 
 router = APIRouter(prefix="/broker", tags=["Broker"])
+@lru_cache(maxsize=1)
 def get_broker_service() ->  BrokerService:
-    return  BrokerService()
+    return  BrokerService(get_stock_service())
+
+BrokerDep = Annotated[BrokerService, Depends(get_broker_service)]
 @router.get("/holdings")
 async def get_broker_holdings(
-        broker_service: BrokerService = Depends(get_broker_service)
+        broker_service: BrokerDep
 
 ):
     return await broker_service.get_enriched_holdings()
@@ -1,19 +1,18 @@
 import logging
-from fastapi import APIRouter
-from fastapi.responses import HTMLResponse
-from datetime import datetime
+from typing import Annotated
+from fastapi import APIRouter, Depends
+from fastapi.responses import HTMLResponse, Response
 
  
-from config.settings import settings
+from config.settings import Settings, get_settings
+from utils.helpers import now_iso
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter( tags=["Home"])
 
-@router.get("/", response_class=HTMLResponse)
-async def root():
-    """Simple HTML interface for testing"""
-    html_template = """
+# Rendered once at import; the page is static
+_HOME_BYTES: bytes = ("""
     <!DOCTYPE html>
     <html>
     <head>
@@ -45,14 +44,18 @@ async def root():
         </div>
     </body>
     </html>
-    """
-    return HTMLResponse(content=html_template)
+    """).encode("utf-8")
+
+@router.get("/", response_class=HTMLResponse, include_in_schema=False)
+async def root():
+    """Simple HTML interface for testing"""
+    return Response(content=_HOME_BYTES, media_type="text/html; charset=utf-8")
 # Health check endpoint
-@router.get("/health")
-async def health_check():
+@router.get("/health", include_in_schema=False)
+async def health_check(settings: Annotated[Settings, Depends(get_settings)]):
     return {
         "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now_iso(),
         "version": settings.app_version,
         "uptime": "active"
     }
\ No newline at end of file
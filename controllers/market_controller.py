@@ -1,56 +1,42 @@
-from fastapi import APIRouter, HTTPException, Query, Depends
-import logging
+from fastapi import APIRouter, Query, Depends
+from functools import lru_cache
+from typing import Annotated
 
 from models.schemas import CompanyInfoSchema, TrendingStocksResponse, SearchResponse
+from controllers.stock_controller import get_stock_service
 from services.market_service import MarketService
-from utils.exceptions import StockAPIException
-
-logger = logging.getLogger(__name__)
+from utils.cache import cached
 
 router = APIRouter(prefix="/market", tags=["Market Data"])
 
-# Dependency to get market service
+# Dependency to get market service; one shared instance per process, so
+# MarketService must stay safe to use from concurrent requests
+@lru_cache(maxsize=1)
 def get_market_service() -> MarketService:
-    return MarketService()
+    return MarketService(get_stock_service())
+
+MarketDep = Annotated[MarketService, Depends(get_market_service)]
 
 @router.get("/trending", response_model=TrendingStocksResponse)
 async def get_trending_stocks(
-    market_service: MarketService = Depends(get_market_service)
+    market_service: MarketDep
 ):
     """Get trending stocks data"""
-    try:
-        result = await market_service.get_trending_stocks()
-        return TrendingStocksResponse(**result)
-    except StockAPIException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.message)
-    except Exception as e:
-        logger.error(f"Unexpected error in get_trending_stocks: {str(e)}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    result = await cached("market:trending", market_service.get_trending_stocks)
+    return TrendingStocksResponse(**result)
 
 @router.get("/indices")
 async def get_market_indices(
-    market_service: MarketService = Depends(get_market_service)
+    market_service: MarketDep
 ):
     """Get market indices data"""
-    try:
-        return await market_service.get_market_indices()
-    except StockAPIException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.message)
-    except Exception as e:
-        logger.error(f"Unexpected error in get_market_indices: {str(e)}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    return await cached("market:indices", market_service.get_market_indices)
 
 @router.get("/search", response_model=CompanyInfoSchema)
 async def search_stock(
-    query: str = Query(..., min_length=1, description="Search term for stock name or symbol"),
-    market_service: MarketService = Depends(get_market_service)
+    market_service: MarketDep,
+    query: str = Query(..., min_length=1, description="Search term for stock name or symbol")
 ):
     """Search stocks by name or symbol"""
-    try:
-        result = await market_service.search_stock(query)
-        return result
-    except StockAPIException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.message)
-    except Exception as e:
-        logger.error(f"Unexpected error in search_stocks: {str(e)}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    result = await market_service.search_stock(query)
+    return result
@@ -1,26 +1,40 @@
 # routes/nse.py
 
-from fastapi import APIRouter, Query
-from fastapi.responses import JSONResponse
+from functools import lru_cache
+from typing import Annotated
+from fastapi import APIRouter, Depends, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from services.nse_service import NseService
+from utils.helpers import split_symbols
+from utils.cache import cached
 from datetime import datetime
 
 router = APIRouter(prefix="/nse",  tags=["NSE Data"])
 
+@lru_cache(maxsize=1)
+def get_nse_service() -> NseService:
+    return NseService()
+
+NseDep = Annotated[NseService, Depends(get_nse_service)]
+
 @router.get("/nseMarket")
-def get_nse_market_status():
-    service = NseService()
-    status = service.get_market_status()
-    return JSONResponse(content=status)
+async def get_nse_market_status(service: NseDep):
+    status = await cached(
+        "nse:market_status",
+        lambda: run_in_threadpool(service.get_market_status),
+    )
+    return ORJSONResponse(content=status)
 
 
 @router.get("/api/announcement/{name}")
-def get_announcement(name: str, days: int = 1):
-    service = NseService()
-    names = [n.strip() for n in name.split(",") if n.strip()]
-    data = service.get_announcements(names, days=days)
+async def get_announcement(
+    name: str, service: NseDep, days: int = 1
+):
+    names = split_symbols(name)
+    data = await run_in_threadpool(service.get_announcements, names, days=days)
 
-    return JSONResponse(content={
+    return ORJSONResponse(content={
         "status": "success",
         "data": data,
         "TimeGenerated": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -1,5 +1,7 @@
 from fastapi import APIRouter, HTTPException, Query, Depends
-from typing import List
+from fastapi.responses import ORJSONResponse
+from functools import lru_cache
+from typing import Annotated, List, Optional
 import logging
 
 from models.schemas import (
@@ -10,147 +12,109 @@ from models.schemas import (
 )
 from models.enums import Period, Interval, DataType
 from services.stock_service import StockService
-from utils.exceptions import StockAPIException
+from utils.helpers import split_symbols
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/stock", tags=["Stock Data"])
 
-# Dependency to get stock service
+# Dependency to get stock service; one shared instance per process, so
+# StockService must stay safe to use from concurrent requests
+@lru_cache(maxsize=1)
 def get_stock_service() -> StockService:
     return StockService()
 
-@router.get("/{symbol}/price", response_model=StockPriceSchema)
+StockDep = Annotated[StockService, Depends(get_stock_service)]
+
+# The hottest routes skip FastAPI's response_model validation pass: the
+# service already returns validated data. The schema stays documented via
+# `responses`.
+@router.get("/{symbol}/price", response_model=None,
+            responses={200: {"model": StockPriceSchema}})
 async def get_stock_price(
     symbol: str,
-    stock_service: StockService = Depends(get_stock_service)
+    stock_service: StockDep
 ):
     """Get current stock price and basic metrics"""
-    try:
-        return await stock_service.get_stock_price(symbol)
-    except StockAPIException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.message)
-    except Exception as e:
-        logger.error(f"Unexpected error in get_stock_price: {str(e)}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    result = await stock_service.get_stock_price(symbol)
+    return ORJSONResponse(result.model_dump())
 
-@router.get("/{symbol}/info", response_model=CompanyInfoSchema)
+@router.get("/{symbol}/info", response_model=None,
+            responses={200: {"model": CompanyInfoSchema}})
 async def get_company_info(
     symbol: str,
-    stock_service: StockService = Depends(get_stock_service)
+    stock_service: StockDep
 ):
     """Get detailed company information"""
-    try:
-        return await stock_service.get_company_info(symbol)
-    except StockAPIException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.message)
-    except Exception as e:
-        logger.error(f"Unexpected error in get_company_info: {str(e)}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    result = await stock_service.get_company_info(symbol)
+    return ORJSONResponse(result.model_dump())
     
 @router.get("/multiple_info/{symbols}", response_model=MultipleInfoResponse)
-async def get_company_info(
+async def get_multiple_company_info(
     symbols: str,
-    stock_service: StockService = Depends(get_stock_service)
+    stock_service: StockDep
 ):
-    """Get detailed company information"""
-    try:
-        listSymbols=symbols.split(",")
-        return await stock_service.get_multiple_company_info(listSymbols)
-    except StockAPIException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.message)
-    except Exception as e:
-        logger.error(f"Unexpected error in get_company_info: {str(e)}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    """Get detailed company information for several symbols"""
+    listSymbols=split_symbols(symbols)
+    return await stock_service.get_multiple_company_info(listSymbols)
 
-@router.get("/{symbol}/history", response_model=HistoricalDataSchema)
+@router.get("/{symbol}/history", response_model=None,
+            responses={200: {"model": HistoricalDataSchema}})
 async def get_historical_data(
     symbol: str,
+    stock_service: StockDep,
     period: Period = Period.ONE_MONTH,
-    interval: Interval = Interval.ONE_DAY,
-    stock_service: StockService = Depends(get_stock_service)
+    interval: Interval = Interval.ONE_DAY
 ):
     """Get historical stock data"""
-    try:
-        return await stock_service.get_historical_data(symbol, period, interval)
-    except StockAPIException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.message)
-    except Exception as e:
-        logger.error(f"Unexpected error in get_historical_data: {str(e)}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    result = await stock_service.get_historical_data(symbol, period, interval)
+    # mode="json" coerces values orjson can't encode natively, such as
+    # Decimal, instead of failing the response
+    return ORJSONResponse(result.model_dump(mode="json"))
 
 @router.get("/{symbol}/financials", response_model=FinancialsSchema)
 async def get_financials(
     symbol: str,
-    stock_service: StockService = Depends(get_stock_service)
+    stock_service: StockDep
 ):
     """Get financial statements"""
-    try:
-        return await stock_service.get_financials(symbol)
-    except StockAPIException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.message)
-    except Exception as e:
-        logger.error(f"Unexpected error in get_financials: {str(e)}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    return await stock_service.get_financials(symbol)
 
 @router.get("/{symbol}/dividends", response_model=DividendsSchema)
 async def get_dividends(
     symbol: str,
-    stock_service: StockService = Depends(get_stock_service)
+    stock_service: StockDep
 ):
     """Get dividend history"""
-    try:
-        return await stock_service.get_dividends(symbol)
-    except StockAPIException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.message)
-    except Exception as e:
-        logger.error(f"Unexpected error in get_dividends: {str(e)}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    return await stock_service.get_dividends(symbol)
 
 @router.get("/{symbol}/splits", response_model=StockSplitSchema)
 async def get_splits(
     symbol: str,
-    stock_service: StockService = Depends(get_stock_service)
+    stock_service: StockDep
 ):
     """Get stock split history"""
-    try:
-        return await stock_service.get_splits(symbol)
-    except StockAPIException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.message)
-    except Exception as e:
-        logger.error(f"Unexpected error in get_splits: {str(e)}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    return await stock_service.get_splits(symbol)
 
 @router.get("/{symbol}/recommendations", response_model=RecommendationSchema)
 async def get_recommendations(
     symbol: str,
-    stock_service: StockService = Depends(get_stock_service)
+    stock_service: StockDep
 ):
     """Get analyst recommendations"""
-    try:
-        return await stock_service.get_recommendations(symbol)
-    except StockAPIException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.message)
-    except Exception as e:
-        logger.error(f"Unexpected error in get_recommendations: {str(e)}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    return await stock_service.get_recommendations(symbol)
 
 
 @router.get("/multiple_stocks", response_model=TrendingStocksResponse)
 async def get_multiple_stocks(
+    stock_service: StockDep,
     symbols: str = Query(..., description="Comma-separated stock symbols"),
-    stock_service: StockService = Depends(get_stock_service)
+    limit: Optional[int] = Query(None, ge=1, description="Return only the N largest by market cap")
 ):
     """Get data for multiple stocks"""
-    try:
-        symbol_list = [s.strip() for s in symbols.split(',') if s.strip()]
-        if not symbol_list:
-            raise HTTPException(status_code=400, detail="No valid symbols provided")
-        
-        result = await stock_service.get_multiple_stocks(symbol_list)
-        return TrendingStocksResponse(**result)
-    except StockAPIException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.message)
-    except Exception as e:
-        logger.error(f"Unexpected error in get_multiple_stocks: {str(e)}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    symbol_list = split_symbols(symbols)
+    if not symbol_list:
+        raise HTTPException(status_code=400, detail="No valid symbols provided")
+    
+    result = await stock_service.get_multiple_stocks(symbol_list, limit)
+    return TrendingStocksResponse(**result)
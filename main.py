@@ -1,17 +1,22 @@
+import asyncio
 import os
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
 from fastapi import APIRouter, Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 import logging
 from fastapi.security import (
     HTTPAuthorizationCredentials,
     HTTPBearer,
     OAuth2PasswordBearer,
 )
+import httpx
 import uvicorn
-from datetime import datetime
+import yfinance as yf
 from dotenv import load_dotenv
 
+from middleware.error_middleware import ErrorMiddleware
 from middleware.security_middleware import SecurityMiddleWare
 
 load_dotenv()
@@ -28,7 +33,15 @@ from controllers import (
 )
 from middleware.logging_middleware import LoggingMiddleware
 from services.market_service import MarketService
+from services.stock_service import StockService
+from services.ai_pdf_agents_service import (
+    StreamingPdfToBlob,
+    DocumentAnalyzerService,
+    LLMSummarizerService,
+)
+from models import schemas
 from utils.exceptions import StockAPIException
+from utils.helpers import now_iso, yf_session
 
 # Configure logging
 logging.basicConfig(
@@ -51,6 +64,46 @@ secured_router = APIRouter(dependencies=[Depends(security)])
 # )
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load the NSE ticker list off the event loop instead of at import time
+    await asyncio.to_thread(MarketService.initialize_csv)
+    # Fresh pools per lifespan, so the app can be started again in the same process
+    StockService.start()
+    MarketService.start()
+    # One pooled HTTP client shared by every service that talks HTTP directly
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        timeout=settings.timeout_seconds,
+    )
+    # Finalize every response schema once so the first requests don't pay for it
+    for model in vars(schemas).values():
+        if (isinstance(model, type) and issubclass(model, schemas.BaseModel)
+                and model.__module__ == schemas.__name__):
+            model.model_rebuild()
+    app.state.services = SimpleNamespace(
+        ingestor=StreamingPdfToBlob(app.state.http),
+        analyzer=DocumentAnalyzerService(),
+        summarizer=LLMSummarizerService(),
+    )
+    if settings.preload_warmup:
+        try:
+            await asyncio.to_thread(lambda: yf.Ticker("AAPL", session=yf_session).info)
+        except Exception as e:
+            logger.warning(f"yfinance warmup failed: {str(e)}")
+    # Build the OpenAPI document once; /openapi.json then serves the cached dict
+    app.openapi()
+    yield
+    await StockService.shutdown()
+    # The NSE client is shared across requests, so close it only if it was created
+    if nse_controller.get_nse_service.cache_info().currsize:
+        nse_controller.get_nse_service().close()
+        nse_controller.get_nse_service.cache_clear()
+    MarketService.shutdown()
+    await app.state.http.aclose()
+
+
 app = FastAPI(
     title="Stock Market API",
     description="""
@@ -59,15 +112,19 @@ app = FastAPI(
 - Example: `Bearer abc12345`
 - Click 'Authorize' and enter your token (omit 'Bearer').
     """,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 
-@app.get("/secure")
+@app.get("/secure", include_in_schema=False)
 def secure_endpoint(credentials: HTTPAuthorizationCredentials = Depends(security)):
     return {"token": credentials.credentials}
 
 
 # Register secured endpoints
+# Catch-all for unhandled errors; added before CORS so the 500 keeps CORS headers
+app.add_middleware(ErrorMiddleware)
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -82,7 +139,6 @@ app.include_router(secured_router)
 app.include_router(auth_controller.router, prefix="/api")
 app.add_middleware(LoggingMiddleware)
 app.add_middleware(SecurityMiddleWare)
-MarketService.initialize_csv()
 # Include routers
 app.include_router(
     stock_controller.router, prefix="/api", dependencies=[Depends(security)]
@@ -99,20 +155,19 @@ app.include_router(
 app.include_router(
     ai_pdf_agents_controller.router, prefix="/api", dependencies=[Depends(security)]
 )
-app.include_router(auth_controller.router, prefix="/api")
 app.include_router(home_controller.router)
 
 
 # Global exception handler
 @app.exception_handler(StockAPIException)
 async def stock_api_exception_handler(request, exc: StockAPIException):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "success": False,
             "message": exc.message,
             "error_code": exc.error_code,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
         },
     )
 
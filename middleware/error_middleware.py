@@ -0,0 +1,50 @@
+import logging
+from fastapi import status
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from utils.helpers import now_iso
+
+logger = logging.getLogger(__name__)
+
+
+class ErrorMiddleware:
+    """Turn unhandled exceptions into the API's JSON error body.
+
+    Registered before CORSMiddleware so it sits inside it and the 500 still
+    carries the CORS headers; Starlette's ``exception_handler(Exception)``
+    runs outside every user middleware and would drop them.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        response_started = False
+
+        async def send_wrapper(message: Message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            # Too late to swap in an error body; let the server drop the connection
+            if response_started:
+                raise
+            logger.exception("Unexpected error in %s", scope["path"])
+            response = ORJSONResponse(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                content={
+                    "success": False,
+                    "message": "Internal server error",
+                    "error_code": "INTERNAL_ERROR",
+                    "timestamp": now_iso(),
+                },
+            )
+            await response(scope, receive, send)
@@ -1,46 +1,55 @@
-
 import logging
-from starlette.middleware.base import BaseHTTPMiddleware
-
 import time
-from starlette.middleware.base import BaseHTTPMiddleware
-from fastapi import Request
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
 logger = logging.getLogger(__name__)
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
+class LoggingMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
         # Start timing
-        start_time = time.time()
+        start_time = time.perf_counter()
         
-        # Get client info
-        client_ip = request.client.host if request.client else "unknown"
-        user_agent = request.headers.get("user-agent", "unknown")
+        request_method = scope["method"]
+        path = scope["path"]
         
         # Log incoming request
-        logger.info(f"🔵 REQUEST: {request.method} {request.url.path} from {client_ip}")
-        logger.info(f"   Headers: Authorization: {'***' if 'authorization' in request.headers else 'None'}")
+        if logger.isEnabledFor(logging.INFO):
+            client = scope.get("client")
+            client_ip = client[0] if client else "unknown"
+            logger.info("REQUEST: %s %s from %s", request_method, path, client_ip)
+        if logger.isEnabledFor(logging.DEBUG):
+            has_auth = any(name == b"authorization" for name, _ in scope["headers"])
+            logger.debug("   Headers: Authorization: %s", '***' if has_auth else 'None')
         
+        status_code = None
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add processing time to response headers
+                process_time = time.perf_counter() - start_time
+                MutableHeaders(scope=message)["X-Process-Time"] = f"{process_time:.4f}"
+            await send(message)
+
         try:
             # Process the request
-            response = await call_next(request)
-            
-            # Calculate processing time
-            process_time = time.time() - start_time
-            
-            # Log response
-            status_emoji = "✅" if response.status_code < 400 else "❌"
-            logger.info(f"{status_emoji} RESPONSE: {request.method} {request.url.path} "
-                       f"Status: {response.status_code} Time: {process_time:.4f}s")
-            
-            # Add processing time to response headers
-            response.headers["X-Process-Time"] = f"{process_time:.4f}"
-            
-            return response
-            
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
-            process_time = time.time() - start_time
-            logger.error(f"❌ ERROR: {request.method} {request.url.path} "
-                        f"Error: {str(e)} Time: {process_time:.4f}s")
-            raise
\ No newline at end of file
+            process_time = time.perf_counter() - start_time
+            logger.error("ERROR: %s %s Error: %s Time: %.4fs",
+                         request_method, path, e, process_time)
+            raise
+
+        # Log response
+        process_time = time.perf_counter() - start_time
+        logger.info("RESPONSE: %s %s Status: %s Time: %.4fs",
+                    request_method, path, status_code, process_time)
@@ -1,29 +1,40 @@
-from fastapi import Request, HTTPException, status
-from fastapi.responses import JSONResponse
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from starlette.middleware.base import BaseHTTPMiddleware
-security = HTTPBearer(
-    scheme_name="Bearer Token",
-    description="Enter your bearer token"
-)
+from fastapi import status
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-class SecurityMiddleWare(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
+# Paths served without a bearer token
+_OPEN_PATHS = frozenset({"/docs", "/redoc", "/openapi.json", "/", "/health", "/api/auth/token"})
+
+
+def _bearer_token(scope: Scope):
+    """Return the bearer token from the raw ASGI headers, or None"""
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            scheme, _, credentials = value.decode("latin-1").partition(" ")
+            if scheme.lower() == "bearer" and credentials:
+                return credentials
+            return None
+    return None
+
+
+class SecurityMiddleWare:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
         # Exclude docs and openapi endpoints
-        if request.url.path in ["/docs", "/redoc", "/openapi.json","/","/health",'/api/auth/token']:
-            return await call_next(request)
+        if scope["type"] != "http" or scope["path"] in _OPEN_PATHS:
+            return await self.app(scope, receive, send)
         # Apply security for all other endpoints
-        try:
-            credentials: HTTPAuthorizationCredentials = await security(request)
-        except Exception as e:
-            return JSONResponse(
+        if _bearer_token(scope) is None:
+            response = ORJSONResponse(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 content={
                     "success": False,
                     "message": "Authentication credentials were not provided or invalid",
-                    "detail": str(e)
+                    "detail": "Not authenticated"
                 }
             )
+            return await response(scope, receive, send)
         # Optional: Verify token here
-        response = await call_next(request)
-        return response
+        await self.app(scope, receive, send)
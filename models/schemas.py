@@ -1,13 +1,13 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, SkipValidation
 from typing import Optional, List, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 
 from models.enums import DataType, Interval, Period
 
 class BaseResponse(BaseModel):
     success: bool = True
     message: str = "Success"
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 class ErrorResponse(BaseResponse):
     success: bool = False
@@ -48,58 +48,71 @@ class CompanyInfoSchema(BaseModel):
     debtToEquity:Optional[float]=None
 
 class MultipleInfoResponse(BaseModel):
-    stocks: List[Dict[str, CompanyInfoSchema]]
+    stocks: Dict[str, CompanyInfoSchema]
     total_stocks: int
     successful_requests: int
     failed_requests: int
     
+# SkipValidation marks payloads the services build themselves, where walking
+# every element of a Dict[str, Any] would only cost time:
+# - history, dividend, split and recommendation rows and the financial and
+#   earnings statements, converted from yfinance DataFrames;
+# - the stock lists in MultipleStocksResponse, TrendingStocksResponse and
+#   SearchResponse, assembled from Yahoo quotes or the static search table.
+
 class HistoricalDataSchema(BaseModel):
     symbol: str
     period: str
     interval: str
-    data: List[Dict[str, Any]]
+    data: SkipValidation[List[Dict[str, Any]]] = Field(
+        ..., description="Rows from yfinance; the Date/Datetime column is epoch milliseconds (UTC)"
+    )
     data_count: int
 
 class FinancialsSchema(BaseModel):
     symbol: str
-    quarterly_financials: Optional[Dict[str, Any]] = None
-    yearly_financials: Optional[Dict[str, Any]] = None
-    balance_sheet: Optional[Dict[str, Any]] = None
-    cash_flow: Optional[Dict[str, Any]] = None
+    quarterly_financials: SkipValidation[Optional[Dict[str, Any]]] = None
+    yearly_financials: SkipValidation[Optional[Dict[str, Any]]] = None
+    balance_sheet: SkipValidation[Optional[Dict[str, Any]]] = None
+    cash_flow: SkipValidation[Optional[Dict[str, Any]]] = None
 
 class DividendsSchema(BaseModel):
     symbol: str
-    dividends: List[Dict[str, Any]]
+    dividends: SkipValidation[List[Dict[str, Any]]] = Field(
+        ..., description="Rows of Date (epoch milliseconds, UTC) and dividend"
+    )
     total_dividends: int
 
 class StockSplitSchema(BaseModel):
     symbol: str
-    splits: List[Dict[str, Any]]
+    splits: SkipValidation[List[Dict[str, Any]]] = Field(
+        ..., description="Rows of Date (epoch milliseconds, UTC) and split_ratio"
+    )
     total_splits: int
 
 class RecommendationSchema(BaseModel):
     symbol: str
-    recommendations: List[Dict[str, Any]]
+    recommendations: SkipValidation[List[Dict[str, Any]]]
 
 class EarningsSchema(BaseModel):
     symbol: str
-    quarterly_earnings: Optional[Dict[str, Any]] = None
-    yearly_earnings: Optional[Dict[str, Any]] = None
-    earnings_calendar: Optional[Dict[str, Any]] = None
+    quarterly_earnings: SkipValidation[Optional[Dict[str, Any]]] = None
+    yearly_earnings: SkipValidation[Optional[Dict[str, Any]]] = None
+    earnings_calendar: SkipValidation[Optional[Dict[str, Any]]] = None
 
 class MultipleStocksResponse(BaseModel):
-    stocks: List[Dict[str, Any]]
+    stocks: SkipValidation[List[Dict[str, Any]]]
     total_stocks: int
     successful_requests: int
     failed_requests: int
 
 class TrendingStocksResponse(BaseModel):
-    trending_stocks: List[Dict[str, Any]]
+    trending_stocks: SkipValidation[List[Dict[str, Any]]]
     total_stocks: int
     market_status: str
 
 class SearchResponse(BaseModel):
-    search_results: List[Dict[str, Any]]
+    search_results: SkipValidation[List[Dict[str, Any]]]
     total_results: int
     query: str
 
@@ -1,7 +1,13 @@
 from abc import ABC, abstractmethod
+import asyncio
+import hashlib
 import logging
+import threading
+from concurrent.futures import Future
+from functools import lru_cache
 import os
-import requests
+import httpx
+from cachetools import TTLCache
 from azure.storage.blob import BlobServiceClient, BlobSasPermissions, generate_blob_sas
 from azure.ai.documentintelligence import DocumentIntelligenceClient
 from azure.core.credentials import AzureKeyCredential
@@ -16,20 +22,61 @@ STORAGE_CONNECTION_STRING = os.getenv("StorageAccountConnectionString")
 AIDocumentKey = os.getenv("AIDocumentKey")
 ENDPOINT = "https://360documents.cognitiveservices.azure.com/"
 CONTAINER_NAME = "ai-test"
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+UPLOAD_BLOCK_SIZE = 4 * 1024 * 1024
+SUMMARY_CACHE_TTL = 24 * 60 * 60
+SUMMARY_TOKEN_BUDGET = 2048
+EXTRACTIVE_THRESHOLD_CHARS = 20_000  # longer documents get a LexRank pre-pass
+EXTRACTIVE_SENTENCES = 40
 MODEL = os.getenv("MODEL")
 print("MODEL: ",MODEL)
+
+# SDK clients are built once on first use and reused, keeping their HTTP
+# connection pools warm; lazily so a missing env var doesn't break import.
+@lru_cache(maxsize=1)
+def _blob_service_client() -> BlobServiceClient:
+    return BlobServiceClient.from_connection_string(
+        STORAGE_CONNECTION_STRING, max_single_put_size=UPLOAD_BLOCK_SIZE, max_block_size=UPLOAD_BLOCK_SIZE
+    )
+
+@lru_cache(maxsize=1)
+def _doc_intel_client() -> DocumentIntelligenceClient:
+    return DocumentIntelligenceClient(endpoint=ENDPOINT, credential=AzureKeyCredential(AIDocumentKey))
+@lru_cache(maxsize=1)
+def _token_encoder():
+    import tiktoken
+    return tiktoken.get_encoding("cl100k_base")
+
+def _extractive_summary(text: str) -> str:
+    """Keep the most salient sentences of a long document (LexRank)"""
+    from sumy.parsers.plaintext import PlaintextParser
+    from sumy.nlp.tokenizers import Tokenizer
+    from sumy.summarizers.lex_rank import LexRankSummarizer
+
+    parser = PlaintextParser.from_string(text, Tokenizer("english"))
+    sentences = LexRankSummarizer()(parser.document, EXTRACTIVE_SENTENCES)
+    return " ".join(str(sentence) for sentence in sentences)
+
+def _prepare_summary_input(text: str) -> str:
+    """Fit document text into the LLM token budget"""
+    if len(text) > EXTRACTIVE_THRESHOLD_CHARS:
+        try:
+            text = _extractive_summary(text)
+        except Exception as e:
+            logger.warning(f"Extractive pre-summary failed, truncating instead: {e}")
+    encoder = _token_encoder()
+    tokens = encoder.encode(text)
+    if len(tokens) > SUMMARY_TOKEN_BUDGET:
+        text = encoder.decode(tokens[:SUMMARY_TOKEN_BUDGET])
+    return text
+
 # --------------------------------------------
 # Interfaces
 # --------------------------------------------
 
-class IDownloadService(ABC):
+class IIngestService(ABC):
     @abstractmethod
-    def download(self, url: str) -> str:
-        pass
-
-class IUploadService(ABC):
-    @abstractmethod
-    def upload(self, file_path: str) -> str:
+    async def ingest(self, url: str) -> str:
         pass
 
 class IAnalyzeService(ABC):
@@ -46,54 +93,68 @@ class ISummarizerService(ABC):
 # Implementations
 # --------------------------------------------
 
-class PDFDownloaderService(IDownloadService):
-    def download(self, url: str) -> str:
-        file_name = url.split("/")[-1]
+class StreamingPdfToBlob(IIngestService):
+    """Download a PDF and upload it to Azure Blob in one pass, without touching local disk."""
+
+    def __init__(self, client: httpx.AsyncClient):
+        self.client = client
+
+    async def ingest(self, url: str) -> str:
+        blob_name = url.split("/")[-1]
         headers = {
             "User-Agent": "Mozilla/5.0",
             "Accept": "application/pdf"
         }
-        response = requests.get(url, headers=headers, allow_redirects=True)
-
-        if response.status_code == 200:
-            with open(file_name, "wb") as f:
-                f.write(response.content)
-            logger.info("PDFDownloaderService is succeded")
-            return file_name
-        logger.info("PDFDownloaderService is failed")
-        
-        raise Exception(f"Failed to download. Status code: {response.status_code}")
-
-class CloudUploaderService(IUploadService):
-    def upload(self, file_path: str) -> str:
-        try:
-            blob_service_client = BlobServiceClient.from_connection_string(STORAGE_CONNECTION_STRING)
-            blob_client = blob_service_client.get_blob_client(container=CONTAINER_NAME, blob=file_path)
-
-            sas_token = generate_blob_sas(
-                account_name=blob_service_client.account_name,
-                account_key=blob_service_client.credential.account_key,
-                container_name=CONTAINER_NAME,
-                blob_name=file_path,
-                permission=BlobSasPermissions(read=True, write=True),
-                start=datetime.now(timezone.utc),
-                expiry=datetime.now(timezone.utc) + timedelta(hours=1)
-            )
-
-            with open(file_path, "rb") as data:
-                blob_client.upload_blob(data, overwrite=True)
-            import os
-            if os.path.exists(file_path):
-                os.remove(file_path)
-            logger.info("CloudUploaderService is succeded")
-            return f"{blob_client.url}?{sas_token}"
-        except Exception as e:
-            raise Exception(f"CloudUploaderService Failed: {e}")
+        async with self.client.stream("GET", url, headers=headers, follow_redirects=True) as response:
+            if response.status_code != 200:
+                logger.info("StreamingPdfToBlob download failed")
+                raise Exception(f"Failed to download. Status code: {response.status_code}")
+
+            loop = asyncio.get_running_loop()
+            chunks = response.aiter_bytes(DOWNLOAD_CHUNK_SIZE)
+
+            async def _next_chunk():
+                return await chunks.__anext__()
+
+            def _iter_chunks():
+                # The blob SDK is sync and runs in a worker thread; pull each
+                # chunk from the async HTTP stream back on the event loop
+                while True:
+                    try:
+                        yield asyncio.run_coroutine_threadsafe(_next_chunk(), loop).result()
+                    except StopAsyncIteration:
+                        return
+
+            length = response.headers.get("Content-Length")
+            try:
+                return await asyncio.to_thread(
+                    self._upload, blob_name, _iter_chunks(), int(length) if length else None
+                )
+            except Exception as e:
+                raise Exception(f"StreamingPdfToBlob Failed: {e}")
+
+    def _upload(self, blob_name: str, data, length) -> str:
+        blob_service_client = _blob_service_client()
+        blob_client = blob_service_client.get_blob_client(container=CONTAINER_NAME, blob=blob_name)
+
+        sas_token = generate_blob_sas(
+            account_name=blob_service_client.account_name,
+            account_key=blob_service_client.credential.account_key,
+            container_name=CONTAINER_NAME,
+            blob_name=blob_name,
+            permission=BlobSasPermissions(read=True, write=True),
+            start=datetime.now(timezone.utc),
+            expiry=datetime.now(timezone.utc) + timedelta(hours=1)
+        )
+
+        blob_client.upload_blob(data, overwrite=True, length=length, max_concurrency=4)
+        logger.info("StreamingPdfToBlob is succeded")
+        return f"{blob_client.url}?{sas_token}"
 
 class DocumentAnalyzerService(IAnalyzeService):
     def analyze(self, file_url: str) -> str:
         try:
-            client = DocumentIntelligenceClient(endpoint=ENDPOINT, credential=AzureKeyCredential(AIDocumentKey))
+            client = _doc_intel_client()
             poller = client.begin_analyze_document("prebuilt-read", AnalyzeDocumentRequest(url_source=file_url))
             result = poller.result()
             logger.info("DocumentAnalyzerService is succeded")
@@ -102,7 +163,14 @@ class DocumentAnalyzerService(IAnalyzeService):
             raise Exception(f"Document Analysis Failed: {e}")
 
 class LLMSummarizerService(ISummarizerService):
-    def summarize(self, text: str) -> str:
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Identical document text gets the cached summary instead of a new LLM call
+        self._summary_cache = TTLCache(maxsize=256, ttl=SUMMARY_CACHE_TTL)
+        # Summaries being generated right now, so concurrent duplicates wait for one run
+        self._in_flight: dict[str, Future] = {}
+
+    def _build_orchestrator(self):
         from agno.agent import Agent
         from agno.models.groq import Groq
         from agno.tools.duckduckgo import DuckDuckGoTools
@@ -144,6 +212,32 @@ class LLMSummarizerService(ISummarizerService):
             ],
             markdown=True
         )
+        return orchestrator
+
+    def summarize(self, text: str) -> str:
+        short_text = _prepare_summary_input(text)
+        key = hashlib.sha256(short_text.encode("utf-8")).hexdigest()
+        with self._lock:
+            summary = self._summary_cache.get(key)
+            if summary is not None:
+                return summary
+            pending = self._in_flight.get(key)
+            owner = pending is None
+            if owner:
+                pending = self._in_flight[key] = Future()
+        if not owner:
+            return pending.result()
 
-        short_text = text[:1000] if len(text) > 1000 else text
-        return orchestrator.run(short_text).content
+        try:
+            # Agents keep per-run state (messages, session), so every run gets its own team
+            summary = self._build_orchestrator().run(short_text).content
+        except BaseException as e:
+            with self._lock:
+                del self._in_flight[key]
+            pending.set_exception(e)
+            raise
+        with self._lock:
+            self._summary_cache[key] = summary
+            del self._in_flight[key]
+        pending.set_result(summary)
+        return summary
@@ -1,62 +1,85 @@
+import asyncio
+import hashlib
+import hmac
 import logging
 import time
 from typing import Optional
-from datetime import datetime, timedelta
-import requests
+import httpx
 
 from config.settings import AZURE_CONFIG
 
 
 logger = logging.getLogger(__name__)
+
 class AzureAuthService:
     def __init__(self):
         self.token_cache = {}
-        self.token_expiry = None
+        self.token_expiry = None  # time.monotonic() deadline
+        self.token_hash = None
         self.app_start_time = time.time()
-    
-    async def get_access_token(self) -> Optional[str]:
-        """Get access token using client credentials flow"""
-        if self.token_cache and self.token_expiry and datetime.now() < self.token_expiry:
+        self._lock = asyncio.Lock()
+
+    def _cached_token(self) -> Optional[str]:
+        if self.token_cache and self.token_expiry and time.monotonic() < self.token_expiry:
             return self.token_cache.get('access_token')
+        return None
+    
+    async def get_access_token(self, http: httpx.AsyncClient) -> Optional[str]:
+        """Get access token using client credentials flow over the app's shared client"""
+        token = self._cached_token()
+        if token:
+            return token
         
         if not all([AZURE_CONFIG['tenant_id'], AZURE_CONFIG['client_id'], AZURE_CONFIG['client_secret']]):
             logger.error("Missing Azure AD configuration")
             return None
         
-        token_url = f"https://login.microsoftonline.com/{AZURE_CONFIG['tenant_id']}/oauth2/v2.0/token"
-        
-        token_data = {
-            'grant_type': 'client_credentials',
-            'client_id': AZURE_CONFIG['client_id'],
-            'client_secret': AZURE_CONFIG['client_secret'],
-            'scope': AZURE_CONFIG['scope']
-        }
-        
-        try:
-            response = requests.post(token_url, data=token_data, timeout=10)
-            response.raise_for_status()
-            
-            token_response = response.json()
-            self.token_cache = token_response
-            
-            expires_in = token_response.get('expires_in', 3600)
-            self.token_expiry = datetime.now() + timedelta(seconds=expires_in - 300)
+        # Only one coroutine refreshes; the rest wait and reuse its token
+        async with self._lock:
+            token = self._cached_token()
+            if token:
+                return token
+
+            token_url = f"https://login.microsoftonline.com/{AZURE_CONFIG['tenant_id']}/oauth2/v2.0/token"
             
-            logger.info("Successfully obtained Azure AD access token")
-            return token_response.get('access_token')
+            token_data = {
+                'grant_type': 'client_credentials',
+                'client_id': AZURE_CONFIG['client_id'],
+                'client_secret': AZURE_CONFIG['client_secret'],
+                'scope': AZURE_CONFIG['scope']
+            }
             
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error getting access token: {e}")
-            return None
+            try:
+                response = await http.post(token_url, data=token_data, timeout=10)
+                response.raise_for_status()
+                
+                token_response = response.json()
+                self.token_cache = token_response
+                
+                expires_in = token_response.get('expires_in', 3600)
+                self.token_expiry = time.monotonic() + expires_in - 300
+                access_token = token_response.get('access_token')
+                self.token_hash = hashlib.sha256(access_token.encode()).digest() if access_token else None
+                
+                logger.info("Successfully obtained Azure AD access token")
+                return access_token
+                
+            except httpx.HTTPError as e:
+                logger.error(f"Error getting access token: {e}")
+                return None
     
-    async def validate_token(self, token: str) -> bool:
+    async def validate_token(self, token: str, http: httpx.AsyncClient) -> bool:
         """Validate the provided token"""
         if not token:
             return False
         
         try:
-            current_token = await self.get_access_token()
-            return token == current_token
+            # Only go to Azure AD when the cached token has expired
+            if not self._cached_token():
+                await self.get_access_token(http)
+            if self.token_hash is None:
+                return False
+            return hmac.compare_digest(hashlib.sha256(token.encode()).digest(), self.token_hash)
         except Exception as e:
             logger.error(f"Token validation error: {e}")
             return False
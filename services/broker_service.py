@@ -10,8 +10,8 @@ import numpy as np
 load_dotenv()
 
 class BrokerService:
-    def __init__(self):
-        self.stock_service = StockService()
+    def __init__(self, stock_service: StockService):
+        self.stock_service = stock_service
             
 
     def fetch_holdings(self):
@@ -59,21 +59,22 @@ class BrokerService:
         df = df.reindex(columns=expected_cols)
 
         # Fill missing values with appropriate defaults
-        df['exchange'] = df['exchange'].fillna("UNKNOWN")
-        df['tradingSymbol'] = df['tradingSymbol'].fillna("UNKNOWN")
-        df['securityId'] = df['securityId'].fillna("NA")
-        df['availableQty'] = df['availableQty'].fillna(0)
-        df['totalQty'] = df['totalQty'].fillna(0)
-        df['isin'] = df['isin'].fillna("NA")
-        df['avgCostPrice'] = df['avgCostPrice'].fillna(0.0)
-        df['brokerName'] = df['brokerName'].fillna("dhan")
+        df = df.fillna({
+            'exchange': "UNKNOWN",
+            'tradingSymbol': "UNKNOWN",
+            'securityId': "NA",
+            'availableQty': 0,
+            'totalQty': 0,
+            'isin': "NA",
+            'avgCostPrice': 0.0,
+            'brokerName': "dhan",
+        })
 
         # Generate quotes
         BOList = ['INDIGRID']
-        df['quote'] = df.apply(
-            lambda row: f"{row['tradingSymbol']}.NS" if row['exchange'] in ['NSE', 'ALL'] and row['tradingSymbol'] not in BOList else f"{row['tradingSymbol']}.BO",
-            axis=1
-        )
+        symbols = df['tradingSymbol'].astype(str)
+        is_nse = df['exchange'].isin(['NSE', 'ALL']) & ~df['tradingSymbol'].isin(BOList)
+        df['quote'] = np.where(is_nse, symbols + '.NS', symbols + '.BO')
 
         # Replace any remaining NaN with None before JSON conversion
         df = df.replace({np.nan: None})
@@ -89,18 +90,15 @@ class BrokerService:
         stock_price_map = await self.stock_service.get_multiple_stocks(quotes)
         company_info_response = await self.stock_service.get_multiple_company_info(quotes)
 
-        # Convert response to dictionary for easy lookup
-        company_info_map = {
-            list(item.keys())[0]: list(item.values())[0]
-            for item in company_info_response.stocks
-        }
+        # Convert responses to dictionaries for O(1) lookup per holding
+        company_info_map = company_info_response.stocks
+        price_map = {s['symbol']: s for s in stock_price_map['trending_stocks']}
 
         enriched = []
-        for _, row in df.iterrows():
-            quote = row['quote']
-            base_data = row.to_dict()
+        for base_data in df.to_dict(orient='records'):
+            quote = base_data['quote']
 
-            price_data = next((s for s in stock_price_map['trending_stocks'] if s['symbol'] == quote), {})
+            price_data = price_map.get(quote, {})
             info_data = company_info_map.get(quote, {})
 
             base_data['price'] = price_data
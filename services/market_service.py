@@ -1,5 +1,8 @@
 import asyncio
-from typing import List, Dict, Any
+import io
+import threading
+import time
+from typing import List, Dict, Any, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
 from services.stock_service import StockService
@@ -7,18 +10,43 @@ import yfinance as yf
 import requests
 import pandas as pd
 from models.schemas import CompanyInfoSchema
-from utils.helpers import get_ticker, validate_symbol, safe_get, format_price, calculate_change
+from utils.helpers import get_ticker, validate_symbol, safe_get, format_price, calculate_change, yf_session
 from config.settings import settings
 import os
+from cachetools import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Shared across requests: prices go stale fast, company metadata rarely changes
+_price_cache = TTLCache(maxsize=1024, ttl=settings.price_cache_ttl)
+_info_cache = TTLCache(maxsize=1024, ttl=86400)
+_cache_lock = threading.Lock()  # executor threads read and write both caches
+_INFO_FIELDS = ('longName', 'shortName', 'marketCap', 'sector', 'trailingPE', 'beta')
+
 class MarketService:
     CSV_PATH = "nse_stocks.csv"
     NSE_CSV_URL = "https://archives.nseindia.com/content/indices/ind_nifty500list.csv"
+    CSV_MAX_AGE = 24 * 60 * 60  # seconds before the saved list is re-downloaded
     df = None
-    def __init__(self):
-        self.executor = ThreadPoolExecutor(max_workers=settings.max_workers)
+    _ticker_index = {}
+    # One pool for every instance; created by start() and released by shutdown() from the app lifespan
+    executor: Optional[ThreadPoolExecutor] = None
+
+    @classmethod
+    def start(cls):
+        """Create the shared executor; safe to call again after shutdown()"""
+        cls.executor = ThreadPoolExecutor(max_workers=settings.max_workers)
+
+    @classmethod
+    def shutdown(cls):
+        """Release the shared executor without waiting on in-flight calls"""
+        if cls.executor is not None:
+            cls.executor.shutdown(wait=False, cancel_futures=True)
+            cls.executor = None
+
+    def __init__(self, stock_service: StockService):
+        # The process-wide StockService, so lookups share its caches and concurrency limit
+        self.stock_service = stock_service
         self.trending_symbols = [
             'AAPL', 'GOOGL', 'MSFT', 'AMZN', 'TSLA', 'META', 'NVDA', 'NFLX', 
             'BABA', 'DIS', 'PYPL', 'ADBE', 'CRM', 'INTC', 'AMD'
@@ -27,32 +55,40 @@ class MarketService:
 
     @staticmethod
     def initialize_csv():
-        print("📥 Downloading NSE stock list...")
-        r = requests.get(MarketService.NSE_CSV_URL)
-        with open(MarketService.CSV_PATH, "wb") as f:
-            f.write(r.content)
+        path = MarketService.CSV_PATH
+        if os.path.exists(path) and time.time() - os.path.getmtime(path) < MarketService.CSV_MAX_AGE:
+            # Saved list is still fresh; skip the NSE download
+            df = pd.read_csv(path)
+            logger.info("initialize_csv loaded cached NSE stock list")
+        else:
+            print("📥 Downloading NSE stock list...")
+            r = requests.get(MarketService.NSE_CSV_URL)
 
-        # Load and transform CSV
-        raw_df = pd.read_csv(MarketService.CSV_PATH)
-        df = raw_df[["Company Name", "Symbol"]].rename(
-            columns={"Company Name": "company", "Symbol": "ticker"}
-        )
-        df["ticker"] = df["ticker"].astype(str) + ".NS"
-        df.to_csv(MarketService.CSV_PATH, index=False)
-        print("✅ NSE stock list saved.")
-        logger.info("initialize_csv is successful")
-        MarketService.df = pd.read_csv(MarketService.CSV_PATH)
+            # Load and transform CSV
+            raw_df = pd.read_csv(io.BytesIO(r.content))
+            df = raw_df[["Company Name", "Symbol"]].rename(
+                columns={"Company Name": "company", "Symbol": "ticker"}
+            )
+            df["ticker"] = df["ticker"].astype(str) + ".NS"
+            df.to_csv(path, index=False)
+            print("✅ NSE stock list saved.")
+            logger.info("initialize_csv is successful")
+        # Lowercase once here so find_ticker doesn't redo it per query
+        df["ticker_lower"] = df["ticker"].str.lower()
+        df["company_lower"] = df["company"].str.lower()
+        MarketService._ticker_index = dict(zip(df["ticker_lower"], df["ticker"]))
+        MarketService.df = df
 
     @staticmethod
     def find_ticker(query: str):
         query_lower = query.strip().lower()
         df = MarketService.df
         # Exact ticker match
-        match = df[df['ticker'].str.lower() == query_lower]
-        if not match.empty:
-            return match.iloc[0]['ticker']
+        ticker = MarketService._ticker_index.get(query_lower)
+        if ticker:
+            return ticker
         # Company name contains
-        match = df[df['company'].str.lower().str.contains(query_lower)]
+        match = df[df['company_lower'].str.contains(query_lower, regex=False, na=False)]
         if not match.empty:
             return match.iloc[0]['ticker']
         return None
@@ -62,25 +98,67 @@ class MarketService:
             return {"error": "Stock not found."}
 
         try:
-            service=StockService()
-            return await service.get_company_info(ticker)
+            return await self.stock_service.get_company_info(ticker)
         except Exception as e:
             return {"error": f"yfinance error: {str(e)}"}
         
+    @staticmethod
+    def _download_history(symbols: List[str], period: str = "2d") -> Dict[str, pd.DataFrame]:
+        """Fetch price history for all symbols in one batched yfinance request"""
+        histories = {}
+        with _cache_lock:
+            for symbol in symbols:
+                hist = _price_cache.get((symbol, period))
+                if hist is not None:
+                    histories[symbol] = hist
+        missing = [symbol for symbol in symbols if symbol not in histories]
+        if not missing:
+            return histories
+
+        data = yf.download(missing, period=period, group_by='ticker', threads=True, progress=False,
+                           session=yf_session)
+        fetched = {}
+        for symbol in missing:
+            try:
+                hist = data[symbol] if isinstance(data.columns, pd.MultiIndex) else data
+            except KeyError:
+                continue
+            # The batch aligns all symbols on one index; drop rows this one lacks
+            fetched[symbol] = hist.dropna(subset=['Close'])
+        with _cache_lock:
+            for symbol, hist in fetched.items():
+                _price_cache[(symbol, period)] = hist
+        histories.update(fetched)
+        return histories
+
+    @staticmethod
+    def _get_info(symbol: str) -> Dict[str, Any]:
+        """Get the info fields used by trending stocks, cached for a day"""
+        with _cache_lock:
+            info = _info_cache.get(symbol)
+        if info is None:
+            full_info = get_ticker(symbol).info
+            info = {key: full_info.get(key) for key in _INFO_FIELDS}
+            with _cache_lock:
+                _info_cache[symbol] = info
+        return info
+
     async def get_trending_stocks(self) -> Dict[str, Any]:
         """Get trending stocks data using threading"""
         
-        def _fetch_trending_stock(symbol: str):
+        def _fetch_trending_stock(symbol: str, hist: Optional[pd.DataFrame]):
             try:
-                ticker = get_ticker(symbol)
-                info = ticker.info
-                hist = ticker.history(period="2d")
-                
-                if hist.empty:
+                if hist is None or hist.empty:
                     return None
+
+                # Prices come from the batch download; info is per symbol
+                info = self._get_info(symbol)
+                
+                closes = hist['Close'].to_numpy()
                 
-                current_price = float(hist['Close'].iloc[-1])
-                previous_close = float(hist['Close'].iloc[-2]) if len(hist) > 1 else current_price
+                current_price = float(closes[-1])
+                
+                previous_close = float(closes[-2]) if closes.size > 1 else current_price
                 change, change_percent = calculate_change(current_price, previous_close)
                 
                 return {
@@ -89,7 +167,7 @@ class MarketService:
                     'current_price': format_price(current_price),
                     'change': change,
                     'change_percent': change_percent,
-                    'volume': int(hist['Volume'].iloc[-1]),
+                    'volume': int(hist['Volume'].to_numpy()[-1]),
                     'market_cap': safe_get(info, 'marketCap'),
                     'sector': safe_get(info, 'sector'),
                     'pe_ratio': safe_get(info, 'trailingPE'),
@@ -101,10 +179,18 @@ class MarketService:
                 return None
         
         # Use ThreadPoolExecutor for parallel processing
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
+
+        try:
+            histories = await loop.run_in_executor(
+                self.executor, self._download_history, self.trending_symbols
+            )
+        except Exception as e:
+            logger.error(f"Error downloading trending stock history: {str(e)}")
+            histories = {}
         
         futures = [
-            loop.run_in_executor(self.executor, _fetch_trending_stock, symbol)
+            loop.run_in_executor(self.executor, _fetch_trending_stock, symbol, histories.get(symbol))
             for symbol in self.trending_symbols
         ]
         
@@ -136,7 +222,7 @@ class MarketService:
                 'total_requested': len(self.trending_symbols),
                 'successful_requests': successful_requests,
                 'failed_requests': failed_requests,
-                'timestamp': asyncio.get_event_loop().time()
+                'timestamp': asyncio.get_running_loop().time()
             }
             
         except Exception as e:
@@ -146,17 +232,16 @@ class MarketService:
     async def get_market_indices(self) -> Dict[str, Any]:
         """Get market indices data"""
         
-        def _fetch_market_index(symbol: str):
+        def _fetch_market_index(symbol: str, hist: Optional[pd.DataFrame]):
             try:
-                ticker = get_ticker(symbol)
-                info = ticker.info
-                hist = ticker.history(period="2d")
-                
-                if hist.empty:
+                if hist is None or hist.empty:
                     return None
                 
-                current_price = float(hist['Close'].iloc[-1])
-                previous_close = float(hist['Close'].iloc[-2]) if len(hist) > 1 else current_price
+                closes = hist['Close'].to_numpy()
+                
+                current_price = float(closes[-1])
+                
+                previous_close = float(closes[-2]) if closes.size > 1 else current_price
                 change, change_percent = calculate_change(current_price, previous_close)
                 
                 # Map symbol to readable name
@@ -168,26 +253,32 @@ class MarketService:
                 
                 return {
                     'symbol': symbol,
-                    'name': name_mapping.get(symbol, safe_get(info, 'longName', symbol)),
+                    'name': name_mapping.get(symbol, symbol),
                     'current_price': format_price(current_price),
                     'change': change,
                     'change_percent': change_percent,
-                    'volume': int(hist['Volume'].iloc[-1]) if 'Volume' in hist else 0
+                    'volume': int(hist['Volume'].to_numpy()[-1]) if 'Volume' in hist else 0
                 }
                 
             except Exception as e:
                 logger.error(f"Error fetching market index {symbol}: {str(e)}")
                 return None
         
-        loop = asyncio.get_event_loop()
-        
-        futures = [
-            loop.run_in_executor(self.executor, _fetch_market_index, symbol)
-            for symbol in self.market_indices
-        ]
+        loop = asyncio.get_running_loop()
+
+        try:
+            histories = await loop.run_in_executor(
+                self.executor, self._download_history, self.market_indices
+            )
+        except Exception as e:
+            logger.error(f"Error downloading market index history: {str(e)}")
+            histories = {}
         
         try:
-            results = await asyncio.gather(*futures, return_exceptions=True)
+            results = [
+                _fetch_market_index(symbol, histories.get(symbol))
+                for symbol in self.market_indices
+            ]
             
             indices = []
             successful_requests = 0
@@ -208,7 +299,7 @@ class MarketService:
                 'total_requested': len(self.market_indices),
                 'successful_requests': successful_requests,
                 'failed_requests': failed_requests,
-                'timestamp': asyncio.get_event_loop().time()
+                'timestamp': asyncio.get_running_loop().time()
             }
             
         except Exception as e:
@@ -229,7 +320,7 @@ class MarketService:
             )
             
             result = {
-                'timestamp': asyncio.get_event_loop().time(),
+                'timestamp': asyncio.get_running_loop().time(),
                 'status': 'success'
             }
             
@@ -258,9 +349,8 @@ class MarketService:
         
         def _fetch_single_stock(symbol: str):
             try:
-                # Validate symbol first
-                if not validate_symbol(symbol):
-                    return {'error': f'Invalid symbol: {symbol}'}
+                # Validate and normalize symbol first
+                symbol = validate_symbol(symbol)
                 
                 ticker = get_ticker(symbol)
                 info = ticker.info
@@ -269,8 +359,11 @@ class MarketService:
                 if hist.empty:
                     return {'error': f'No data available for {symbol}'}
                 
-                current_price = float(hist['Close'].iloc[-1])
-                previous_close = float(hist['Close'].iloc[-2]) if len(hist) > 1 else current_price
+                closes = hist['Close'].to_numpy()
+                
+                current_price = float(closes[-1])
+                
+                previous_close = float(closes[-2]) if closes.size > 1 else current_price
                 change, change_percent = calculate_change(current_price, previous_close)
                 
                 return {
@@ -279,7 +372,7 @@ class MarketService:
                     'current_price': format_price(current_price),
                     'change': change,
                     'change_percent': change_percent,
-                    'volume': int(hist['Volume'].iloc[-1]),
+                    'volume': int(hist['Volume'].to_numpy()[-1]),
                     'market_cap': safe_get(info, 'marketCap'),
                     'sector': safe_get(info, 'sector'),
                     'industry': safe_get(info, 'industry'),
@@ -288,14 +381,14 @@ class MarketService:
                     'dividend_yield': safe_get(info, 'dividendYield'),
                     'fifty_two_week_high': safe_get(info, 'fiftyTwoWeekHigh'),
                     'fifty_two_week_low': safe_get(info, 'fiftyTwoWeekLow'),
-                    'timestamp': asyncio.get_event_loop().time()
+                    'timestamp': time.monotonic()
                 }
                 
             except Exception as e:
                 logger.error(f"Error fetching stock {symbol}: {str(e)}")
                 return {'error': f'Failed to fetch data for {symbol}: {str(e)}'}
         
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         
         try:
             result = await loop.run_in_executor(self.executor, _fetch_single_stock, symbol)
@@ -304,10 +397,6 @@ class MarketService:
         except Exception as e:
             logger.error(f"Error in get_single_stock: {str(e)}")
             return {'error': f'Failed to fetch data for {symbol}: {str(e)}'}
-    
-    def __del__(self):
-        """Cleanup executor on service destruction"""
-        if hasattr(self, 'executor'):
-            self.executor.shutdown(wait=True)
+
 
 
@@ -6,19 +6,24 @@ from nse import NSE
 from concurrent.futures import ThreadPoolExecutor
 
 class NseService:
+    # Shared, bounded pool: NSE throttles bursts and threads are reused across calls
+    _executor = ThreadPoolExecutor(max_workers=8)
+
     def __init__(self):
         self.dir = Path(__file__).resolve().parent
         self.nse = NSE(download_folder=self.dir)
 
+    def close(self):
+        """Close the NSE HTTP client; called once at app shutdown"""
+        self.nse.exit()
+
     def get_market_status(self):
-        try:
-            return self.nse.status()
-        finally:
-            self.nse.exit()
+        return self.nse.status()
 
     def get_announcements(self, symbols: list[str], days: int = 1):
-        from_date = datetime.now() - timedelta(days=days)
         to_date = datetime.now()
+        from_date = to_date - timedelta(days=days)
+        generated_at = to_date.strftime("%Y-%m-%d %H:%M:%S")
 
         def fetch_announcement(symbol):
             try:
@@ -26,19 +31,14 @@ class NseService:
                 return {
                     "symbol": symbol,
                     "data": data,
-                    "TimeGenerated": (
-                        datetime.strptime(data[0]["sort_date"], "%Y-%m-%d %H:%M:%S").strftime("%Y-%m-%d %H:%M:%S")
-                        if data else datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    )
+                    # sort_date is already "%Y-%m-%d %H:%M:%S"; no need to re-parse it
+                    "TimeGenerated": data[0]["sort_date"] if data else generated_at
                 }
             except Exception as e:
-                return {"symbol": symbol, "error": str(e), "TimeGenerated": datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+                return {"symbol": symbol, "error": str(e), "TimeGenerated": generated_at}
 
-        try:
-            with ThreadPoolExecutor() as executor:
-                results = list(executor.map(fetch_announcement, symbols))
-        finally:
-            self.nse.exit()
+        results = self._executor.map(fetch_announcement, symbols)
 
-        return [r for r in results if len(r['data'])!=0]
+        # Failed lookups carry "error" instead of "data"
+        return [r for r in results if r.get('data')]
 
@@ -1,11 +1,22 @@
 import asyncio
 import concurrent.futures
-from typing import Optional, List, Dict, Any
+import hashlib
+import heapq
+import random
+import threading
+import time
+from collections import defaultdict
+from typing import Optional, List, Dict, Any, NamedTuple, Tuple, Type
+import orjson
+import redis.asyncio as aioredis
 import yfinance as yf
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from cachetools import LRUCache, TTLCache
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from pydantic import BaseModel
+from redis.exceptions import RedisError
 
 from models.schemas import (
     MultipleInfoResponse, StockPriceSchema, CompanyInfoSchema, HistoricalDataSchema,
@@ -13,17 +24,178 @@ from models.schemas import (
     RecommendationSchema, EarningsSchema
 )
 from models.enums import Period, Interval
-from utils.helpers import get_ticker, df_to_dict, validate_symbol, safe_get, format_price, calculate_change
-from utils.exceptions import DataNotFoundException, TimeoutException
+from utils.helpers import get_ticker, df_to_dict, validate_symbol, safe_get, format_price, calculate_change, calculate_changes, fetch_quotes, yf_session
+from utils.exceptions import DataNotFoundException, InvalidSymbolException, StockAPIException, TimeoutException
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+QUOTE_BATCH_SIZE = 200  # Yahoo caps symbols per quote request
+# CompanyInfoSchema field -> yfinance info key
+_INFO_FIELD_MAP = {
+    'sector': 'sector',
+    'industry': 'industry',
+    'country': 'country',
+    'website': 'website',
+    'business_summary': 'longBusinessSummary',
+    'market_cap': 'marketCap',
+    'employees': 'fullTimeEmployees',
+    'dividend_yield': 'dividendYield',
+    'pe_ratio': 'trailingPE',
+    'beta': 'beta',
+    'revenue': 'totalRevenue',
+    'profit_margin': 'profitMargins',
+    'bookValue': 'bookValue',
+    'priceToBook': 'priceToBook',
+    'quickRatio': 'quickRatio',
+    'debtToEquity': 'debtToEquity',
+}
+_INDEX_NAMES = {
+    '^GSPC': 'S&P 500',
+    '^DJI': 'Dow Jones',
+    '^IXIC': 'NASDAQ'
+}
+# Quote fields kept in the cache; enough for both the price schema and the trending dict
+_QUOTE_FIELDS = (
+    'regularMarketPrice', 'regularMarketPreviousClose', 'regularMarketVolume', 'marketCap',
+    'regularMarketDayHigh', 'regularMarketDayLow', 'fiftyTwoWeekHigh', 'fiftyTwoWeekLow',
+    'longName', 'shortName', 'sector',
+)
+
+# Redis payload prefix marking a cached not-found result
+_NEGATIVE_MARKER = b"\x00neg:"
+
+
+class _NegativeEntry(NamedTuple):
+    """A recently seen not-found error; fields match StockAPIException's arguments"""
+    message: str
+    status_code: int
+    error_code: str
+
+
+def _ttl_with_jitter(base: int) -> int:
+    """Spread expiries so keys cached together are not refetched together"""
+    return base + random.randint(0, base // 10)
+
+
+def _info_hash(info: Dict[str, Any]) -> bytes:
+    """Content hash of a raw yfinance info payload"""
+    return hashlib.blake2b(orjson.dumps(info, default=str, option=orjson.OPT_SORT_KEYS), digest_size=16).digest()
+
+
+def _validate_each(symbols: List[str]) -> Tuple[List[str], Dict[str, InvalidSymbolException]]:
+    """Validate symbols one by one so a single bad entry doesn't reject the whole batch"""
+    valid = []
+    invalid = {}
+    for symbol in symbols:
+        try:
+            valid.append(validate_symbol(symbol))
+        except InvalidSymbolException as e:
+            invalid[symbol] = e
+    return valid, invalid
+
+
+def _market_cap(stock: Dict[str, Any]) -> int:
+    return stock['market_cap'] or 0
+
+
+def _populated_fields(schema: BaseModel) -> int:
+    return sum(getattr(schema, name) is not None for name in type(schema).model_fields)
+
+
+# Extended stock database for search, lowercased once at import as
+# (symbol, name, symbol_lower, name_lower, name_words_lower)
+_STOCK_NAMES = {
+    'AAPL': 'Apple Inc.',
+    'GOOGL': 'Alphabet Inc.',
+    'MSFT': 'Microsoft Corporation',
+    'AMZN': 'Amazon.com Inc.',
+    'TSLA': 'Tesla Inc.',
+    'META': 'Meta Platforms Inc.',
+    'NVDA': 'NVIDIA Corporation',
+    'NFLX': 'Netflix Inc.',
+    'BABA': 'Alibaba Group Holding Ltd.',
+    'DIS': 'The Walt Disney Company',
+    'PYPL': 'PayPal Holdings Inc.',
+    'ADBE': 'Adobe Inc.',
+    'CRM': 'Salesforce Inc.',
+    'INTC': 'Intel Corporation',
+    'AMD': 'Advanced Micro Devices Inc.',
+    'ORCL': 'Oracle Corporation',
+    'IBM': 'International Business Machines Corporation',
+    'UBER': 'Uber Technologies Inc.',
+    'LYFT': 'Lyft Inc.',
+    'SPOT': 'Spotify Technology S.A.',
+    'TWTR': 'Twitter Inc.',
+    'SNAP': 'Snap Inc.',
+    'ZM': 'Zoom Video Communications Inc.',
+    'SLACK': 'Slack Technologies Inc.',
+    'SQ': 'Square Inc.',
+    'SHOP': 'Shopify Inc.'
+}
+_STOCK_DB: Tuple[Tuple[str, str, str, str, Tuple[str, ...]], ...] = tuple(
+    (symbol, name, symbol.lower(), name.lower(), tuple(name.lower().split()))
+    for symbol, name in _STOCK_NAMES.items()
+)
+
+
+def _build_search_index() -> Dict[str, set]:
+    """Map every trigram of each symbol and name to the entries containing it"""
+    index = defaultdict(set)
+    for i, (_, _, symbol_lower, name_lower, _) in enumerate(_STOCK_DB):
+        for text in (symbol_lower, name_lower):
+            for start in range(len(text) - 2):
+                index[text[start:start + 3]].add(i)
+    return dict(index)
+
+
+_SEARCH_INDEX = _build_search_index()
+
+
+def _calculate_match_score(query: str, symbol_lower: str, name_lower: str, name_words: Tuple[str, ...]) -> float:
+    """Calculate match score for search results"""
+    score = 0.0
+    
+    # Exact symbol match gets highest score
+    if query == symbol_lower:
+        score += 100
+    elif query in symbol_lower:
+        score += 50
+    
+    # Exact name match
+    if query == name_lower:
+        score += 90
+    elif query in name_lower:
+        score += 30
+    
+    # Word match in name
+    for word in name_words:
+        if query in word:
+            score += 20
+        elif word.startswith(query):
+            score += 15
+    
+    return score
+
+
 class StockService:
+    # Shared by every instance; created by start() and released by shutdown() from the app lifespan
+    executor: Optional[ThreadPoolExecutor] = None
+    _semaphore: Optional[asyncio.Semaphore] = None
+    # Shared across uvicorn workers when configured; falls back to the per-instance cache
+    _redis: Optional[aioredis.Redis] = None
+
     def __init__(self):
-        self.executor = ThreadPoolExecutor(max_workers=settings.max_workers)
-        self.cache = {}  # Simple in-memory cache
+        # In-memory fallback when Redis is not configured
+        self.cache = TTLCache(maxsize=settings.cache_max_entries, ttl=settings.cache_timeout)
+        self._negative = TTLCache(maxsize=settings.cache_max_entries, ttl=settings.negative_cache_ttl)
+        self._cache_lock = threading.Lock()
         self.cache_timeout = settings.cache_timeout
+        # Last accepted company info per symbol as (schema, accepted_at, content_hash);
+        # kept for settings.info_retention_seconds, well past the cache TTL, so
+        # refreshes after a cache miss can still be compared against it.
+        self._info_versions = LRUCache(maxsize=4096)
+        self._info_lock = threading.Lock()
 
     def _get_cache_key(self, symbol: str, data_type: str, **kwargs) -> str:
         """Generate cache key"""
@@ -32,95 +204,205 @@ class StockService:
             key_parts.append(f"{k}:{v}")
         return ":".join(key_parts)
 
-    def _get_from_cache(self, key: str) -> Optional[Any]:
-        """Get data from cache if not expired"""
-        if key in self.cache:
-            data, timestamp = self.cache[key]
-            if datetime.now() - timestamp < timedelta(seconds=self.cache_timeout):
-                return data
-            else:
-                del self.cache[key]
-        return None
-
-    def _set_cache(self, key: str, data: Any):
-        """Set data in cache with timestamp"""
-        self.cache[key] = (data, datetime.now())
-
-    def _fetch_stock_data(self, symbol: str, schema_required: bool = False) -> Any:
-        """Fetch stock data from yfinance. Return schema or dict based on flag."""
-        ticker = get_ticker(symbol)
-        info = ticker.info
-        hist = ticker.history(period="5d" if schema_required else "2d")
+    def _get_local(self, key: str) -> Optional[Any]:
+        with self._cache_lock:
+            negative = self._negative.get(key)
+            return negative if negative is not None else self.cache.get(key)
+
+    @staticmethod
+    def _decode(raw: Optional[bytes], model: Optional[Type[BaseModel]]) -> Optional[Any]:
+        if raw is None:
+            return None
+        if raw.startswith(_NEGATIVE_MARKER):
+            return _NegativeEntry(*orjson.loads(raw[len(_NEGATIVE_MARKER):]))
+        return model.model_validate_json(raw) if model else orjson.loads(raw)
+
+    async def _get_from_cache(self, key: str, model: Optional[Type[BaseModel]] = None) -> Optional[Any]:
+        """Get data from cache if not expired; model rebuilds schemas stored in Redis.
+
+        Re-raises the stored error for keys recently recorded by _set_negative.
+        """
+        if self._redis is None:
+            value = self._get_local(key)
+        else:
+            try:
+                value = self._decode(await self._redis.get(key), model)
+            except RedisError as e:
+                logger.warning("Redis get failed for %s: %s", key, e)
+                return None
+        if isinstance(value, _NegativeEntry):
+            raise StockAPIException(*value)
+        return value
+
+    async def _get_many_from_cache(self, keys: List[str], model: Optional[Type[BaseModel]] = None) -> List[Optional[Any]]:
+        """Look up several keys in one round trip; negative entries come back as _NegativeEntry"""
+        if self._redis is None:
+            return [self._get_local(key) for key in keys]
+        try:
+            return [self._decode(raw, model) for raw in await self._redis.mget(keys)]
+        except RedisError as e:
+            logger.warning("Redis mget failed: %s", e)
+            return [None] * len(keys)
+
+    async def _set_cache(self, key: str, data: Any):
+        """Set data in cache; Redis entries get a jittered TTL"""
+        if self._redis is None:
+            with self._cache_lock:
+                self._negative.pop(key, None)
+                self.cache[key] = data
+            return
+        ttl = _ttl_with_jitter(self.cache_timeout)
+        payload = data.model_dump_json() if isinstance(data, BaseModel) else orjson.dumps(data)
+        try:
+            await self._redis.set(key, payload, ex=ttl)
+        except RedisError as e:
+            logger.warning("Redis set failed for %s: %s", key, e)
+
+    async def _set_negative(self, key: str, exc: StockAPIException):
+        """Remember a not-found result for negative_cache_ttl so repeats skip Yahoo"""
+        entry = _NegativeEntry(exc.message, exc.status_code, exc.error_code)
+        if self._redis is None:
+            with self._cache_lock:
+                self._negative[key] = entry
+            return
+        try:
+            await self._redis.set(key, _NEGATIVE_MARKER + orjson.dumps(list(entry)), ex=settings.negative_cache_ttl)
+        except RedisError as e:
+            logger.warning("Redis set failed for %s: %s", key, e)
+
+    async def _run_blocking(self, fn, *args, timeout: Optional[float] = settings.timeout_seconds) -> Any:
+        """Run a blocking yfinance call on the executor with bounded concurrency.
+
+        Pass timeout=None when the caller applies its own deadline.
+        """
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self.executor, fn, *args)
+            try:
+                return await asyncio.wait_for(future, timeout=timeout)
+            except asyncio.TimeoutError:
+                raise TimeoutException()
+
+    @staticmethod
+    def _quote_to_price(symbol: str, quote: Dict[str, Any]) -> StockPriceSchema:
+        """Map a raw Yahoo quote to the price schema"""
+        current_price = float(quote['regularMarketPrice'])
+        previous_close = float(safe_get(quote, 'regularMarketPreviousClose') or current_price)
+        change, change_percent = calculate_change(current_price, previous_close)
 
-        if hist.empty:
-            raise DataNotFoundException(symbol, "price")
+        return StockPriceSchema(
+            symbol=symbol,
+            current_price=format_price(current_price),
+            previous_close=format_price(previous_close),
+            change=change,
+            change_percent=change_percent,
+            volume=int(safe_get(quote, 'regularMarketVolume') or 0),
+            market_cap=safe_get(quote, 'marketCap'),
+            day_high=format_price(safe_get(quote, 'regularMarketDayHigh')),
+            day_low=format_price(safe_get(quote, 'regularMarketDayLow')),
+            fifty_two_week_high=format_price(safe_get(quote, 'fiftyTwoWeekHigh')),
+            fifty_two_week_low=format_price(safe_get(quote, 'fiftyTwoWeekLow'))
+        )
 
-        current_price = float(hist['Close'].iloc[-1])
-        previous_close = float(hist['Close'].iloc[-2]) if len(hist) > 1 else current_price
-        change, change_percent = calculate_change(current_price, previous_close)
+    @staticmethod
+    def _quotes_to_stocks(symbols: List[str], quotes: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Map raw quotes to trending-list dicts, computing every change in one pass"""
+        rows = [quotes[symbol] for symbol in symbols]
+        current = np.array([row['regularMarketPrice'] for row in rows], dtype=float)
+        previous = np.array(
+            [row.get('regularMarketPreviousClose') or row['regularMarketPrice'] for row in rows], dtype=float
+        )
+        changes, change_percents = calculate_changes(current, previous)
 
-        if schema_required:
-            return StockPriceSchema(
-                symbol=symbol,
-                current_price=format_price(current_price),
-                previous_close=format_price(previous_close),
-                change=change,
-                change_percent=change_percent,
-                volume=int(hist['Volume'].iloc[-1]),
-                market_cap=safe_get(info, 'marketCap'),
-                day_high=format_price(safe_get(info, 'dayHigh')),
-                day_low=format_price(safe_get(info, 'dayLow')),
-                fifty_two_week_high=format_price(safe_get(info, 'fiftyTwoWeekHigh')),
-                fifty_two_week_low=format_price(safe_get(info, 'fiftyTwoWeekLow'))
-            )
-        else:
-            return {
+        return [
+            {
                 'symbol': symbol,
-                'name': safe_get(info, 'longName', safe_get(info, 'shortName', '')),
-                'current_price': format_price(current_price),
+                'name': safe_get(row, 'longName', safe_get(row, 'shortName', '')),
+                'current_price': format_price(price),
                 'change': change,
                 'change_percent': change_percent,
-                'volume': int(hist['Volume'].iloc[-1]),
-                'market_cap': safe_get(info, 'marketCap'),
-                'sector': safe_get(info, 'sector')
+                'volume': int(safe_get(row, 'regularMarketVolume') or 0),
+                'market_cap': safe_get(row, 'marketCap'),
+                'sector': safe_get(row, 'sector')
             }
+            for symbol, row, price, change, change_percent
+            in zip(symbols, rows, current.tolist(), changes, change_percents)
+        ]
+
+    def _fetch_quotes_raw(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch trimmed raw quotes keyed by symbol, one request per QUOTE_BATCH_SIZE symbols"""
+        quotes = {}
+        for start in range(0, len(symbols), QUOTE_BATCH_SIZE):
+            batch = symbols[start:start + QUOTE_BATCH_SIZE]
+            fetched = fetch_quotes(batch)
+            for symbol in batch:
+                quote = fetched.get(symbol)
+                if not quote or quote.get('regularMarketPrice') is None:
+                    logger.warning(f"No quote returned for {symbol}")
+                    continue
+                quotes[symbol] = {field: quote.get(field) for field in _QUOTE_FIELDS}
+        return quotes
+
+    async def _get_quotes(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Raw quotes for symbols, shared by the price and multi-stock paths via (symbol, "quote")"""
+        cache_keys = [self._get_cache_key(symbol, "quote") for symbol in symbols]
+        cached_results = await self._get_many_from_cache(cache_keys)
+        quotes = {}
+        misses = []
+        for symbol, cached in zip(symbols, cached_results):
+            if isinstance(cached, _NegativeEntry):
+                continue  # Yahoo had no quote for it moments ago
+            if cached:
+                quotes[symbol] = cached
+            else:
+                misses.append(symbol)
+
+        if misses:
+            fetched = await self._run_blocking(self._fetch_quotes_raw, misses)
+            for symbol in misses:
+                key = self._get_cache_key(symbol, "quote")
+                if symbol in fetched:
+                    await self._set_cache(key, fetched[symbol])
+                else:
+                    await self._set_negative(key, DataNotFoundException(symbol, "price"))
+            quotes.update(fetched)
+        return quotes
 
     async def get_stock_price(self, symbol: str) -> StockPriceSchema:
         symbol = validate_symbol(symbol)
-        cache_key = self._get_cache_key(symbol, "price")
-        cached_data = self._get_from_cache(cache_key)
-        if cached_data:
-            return cached_data
-
         try:
-            loop = asyncio.get_event_loop()
-            future = loop.run_in_executor(self.executor, self._fetch_stock_data, symbol, True)
-            result = await asyncio.wait_for(future, timeout=settings.timeout_seconds)
-            self._set_cache(cache_key, result)
-            return result
-        except asyncio.TimeoutError:
-            raise TimeoutException()
+            quote = (await self._get_quotes([symbol])).get(symbol)
+        except TimeoutException:
+            raise
         except Exception as e:
             logger.error(f"Error fetching price for {symbol}: {str(e)}")
             raise
 
-    async def get_multiple_stocks(self, symbols: List[str]) -> Dict[str, Any]:
-        validated_symbols = [validate_symbol(symbol) for symbol in symbols]
+        if quote is None:
+            raise DataNotFoundException(symbol, "price")
+        return self._quote_to_price(symbol, quote)
 
-        loop = asyncio.get_event_loop()
-        futures = [
-            loop.run_in_executor(self.executor, self._safe_fetch_stock_data, symbol)
-            for symbol in validated_symbols
-        ]
+    async def get_multiple_stocks(self, symbols: List[str], limit: Optional[int] = None) -> Dict[str, Any]:
+        """Quotes for symbols ordered by market cap; limit keeps only the largest N"""
+        valid, invalid = _validate_each(symbols)
+        if invalid:
+            logger.warning(f"Skipping invalid symbols: {', '.join(map(str, invalid))}")
+        validated_symbols = list(dict.fromkeys(valid))
 
-        results = await asyncio.gather(*futures, return_exceptions=True)
+        try:
+            quotes = await self._get_quotes(validated_symbols)
+        except Exception as e:
+            logger.error(f"Error fetching quotes for {len(validated_symbols)} symbols: {str(e)}")
+            quotes = {}
 
-        trending_stocks = [
-            result for result in results
-            if isinstance(result, dict) and 'error' not in result
-        ]
+        trending_stocks = self._quotes_to_stocks(
+            [symbol for symbol in validated_symbols if symbol in quotes], quotes
+        )
 
-        trending_stocks.sort(key=lambda x: x.get('market_cap', 0) or 0, reverse=True)
+        if limit is not None and limit < len(trending_stocks):
+            trending_stocks = heapq.nlargest(limit, trending_stocks, key=_market_cap)
+        else:
+            trending_stocks.sort(key=_market_cap, reverse=True)
 
         return {
             'trending_stocks': trending_stocks,
@@ -128,128 +410,138 @@ class StockService:
             'market_status': 'active'
         }
 
-    def _safe_fetch_stock_data(self, symbol: str) -> Dict[str, Any]:
-        try:
-            return self._fetch_stock_data(symbol, schema_required=False)
-        except Exception as e:
-            logger.error(f"Error fetching data for {symbol}: {str(e)}")
-            return {'symbol': symbol, 'error': str(e)}
+    def _recent_info(self, symbol: str, now: float) -> Optional[Tuple[CompanyInfoSchema, float, bytes]]:
+        """The last accepted info for symbol, if it is still within the retention window"""
+        previous = self._info_versions.get(symbol)
+        if previous is not None and now - previous[1] < settings.info_retention_seconds:
+            return previous
+        return None
+
+    def _accept_company_info(self, symbol: str, candidate: CompanyInfoSchema, content_hash: bytes) -> CompanyInfoSchema:
+        """Keep the richer of the candidate and the previously accepted info"""
+        now = time.monotonic()
+        with self._info_lock:
+            previous = self._recent_info(symbol, now)
+            if previous is not None and _populated_fields(candidate) < _populated_fields(previous[0]):
+                return previous[0]
+            self._info_versions[symbol] = (candidate, now, content_hash)
+            return candidate
+
     def _fetch_company_info(self, symbol: str) -> CompanyInfoSchema:
         try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
-            
-            return CompanyInfoSchema(
-                symbol=symbol,
-                name=safe_get(info, "longName", safe_get(info, "shortName", "")),
-                sector=info.get("sector"),
-                industry=info.get("industry"),
-                country=info.get("country"),
-                website=info.get("website"),
-                business_summary=info.get("longBusinessSummary"),
-                market_cap=info.get("marketCap"),
-                employees=info.get("fullTimeEmployees"),
-                dividend_yield=info.get("dividendYield"),
-                pe_ratio=info.get("trailingPE"),
-                beta=info.get("beta"),
-                revenue=info.get("totalRevenue"),
-                profit_margin=info.get("profitMargins"),
-                bookValue=info.get("bookValue"),
-                priceToBook=info.get("priceToBook"),
-                quickRatio=info.get("quickRatio"),
-                debtToEquity=info.get("debtToEquity"),
-            )
+            info = yf.Ticker(symbol, session=yf_session).info
         except Exception as e:
+            # Transport failure, timeout or rate limit: serve the last good entry if
+            # it is recent enough, otherwise let the error through uncached
             logger.error(f"Failed to fetch company info for {symbol}: {str(e)}")
-            return CompanyInfoSchema(
-                symbol=symbol,
-                name="",
-                business_summary=f"Error: {str(e)}"
-            )
+            with self._info_lock:
+                previous = self._recent_info(symbol, time.monotonic())
+            if previous is not None:
+                return previous[0]
+            raise
 
-    async def get_company_info(self, symbol: str) -> Dict[str, Any]:
+        if not info:
+            # Yahoo answered but knows nothing about the symbol
+            with self._info_lock:
+                previous = self._recent_info(symbol, time.monotonic())
+            if previous is not None:
+                return previous[0]
+            raise DataNotFoundException(symbol, "company info")
+
+        # Upstream unchanged since the last refresh: reuse the schema we already built
+        content_hash = _info_hash(info)
+        with self._info_lock:
+            previous = self._info_versions.get(symbol)
+            if previous is not None and previous[2] == content_hash:
+                self._info_versions[symbol] = (previous[0], time.monotonic(), content_hash)
+                return previous[0]
+
+        candidate = CompanyInfoSchema(
+            symbol=symbol,
+            name=safe_get(info, "longName", safe_get(info, "shortName", "")),
+            **{field: info.get(key) for field, key in _INFO_FIELD_MAP.items()}
+        )
+        return self._accept_company_info(symbol, candidate, content_hash)
+
+    async def get_company_info(self, symbol: str) -> CompanyInfoSchema:
         symbol = validate_symbol(symbol)
         cache_key = self._get_cache_key(symbol, "company_info")
         
-        cached = self._get_from_cache(cache_key)
+        cached = await self._get_from_cache(cache_key, CompanyInfoSchema)
         if cached:
             return cached
         
-        loop = asyncio.get_event_loop()
-        future = loop.run_in_executor(self.executor, self._fetch_company_info, symbol)
-        result = await asyncio.wait_for(future, timeout=settings.timeout_seconds)
-        
-        # Convert CompanyInfoSchema to dict for caching and return
-        result_dict = result.model_dump() if hasattr(result, 'model_dump') else result.__dict__
-        self._set_cache(cache_key, result_dict)
-        return result_dict
+        try:
+            result = await self._run_blocking(self._fetch_company_info, symbol)
+        except DataNotFoundException as e:
+            await self._set_negative(cache_key, e)
+            raise
+        await self._set_cache(cache_key, result)
+        return result
 
     async def get_multiple_company_info(self, symbols: List[str]) -> MultipleInfoResponse:
-        validated = [validate_symbol(s) for s in symbols]
-        
-        loop = asyncio.get_event_loop()
-        tasks = []
-        
-        for symbol in validated:
-            cache_key = self._get_cache_key(symbol, "company_info")
-            cached = self._get_from_cache(cache_key)
-            if cached:
-                # Create a coroutine that returns the cached result
-                async def return_cached(cached_data=cached):
-                    return cached_data
-                tasks.append(return_cached())
+        validated, invalid = _validate_each(symbols)
+
+        cache_keys = [self._get_cache_key(symbol, "company_info") for symbol in validated]
+        cached_results = await self._get_many_from_cache(cache_keys, CompanyInfoSchema)
+
+        found: Dict[str, CompanyInfoSchema] = {}
+        misses: List[str] = []
+        negatives: Dict[str, _NegativeEntry] = {}
+        for symbol, cached in zip(validated, cached_results):
+            if isinstance(cached, _NegativeEntry):
+                negatives[symbol] = cached
+            elif cached:
+                found[symbol] = cached
             else:
-                task = loop.run_in_executor(self.executor, self._fetch_company_info, symbol)
-                tasks.append(asyncio.wait_for(task, timeout=settings.timeout_seconds))
-        
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        stocks: List[Dict[str, CompanyInfoSchema]] = []
-        success_count = 0
+                misses.append(symbol)
+
+        # One deadline for the whole batch; the semaphore in _run_blocking bounds concurrency.
+        # Symbols still pending at the deadline are reported as timed out, the rest are kept.
+        tasks = {
+            symbol: asyncio.ensure_future(self._run_blocking(self._fetch_company_info, symbol, timeout=None))
+            for symbol in dict.fromkeys(misses)
+        }
+        done = set()
+        if tasks:
+            done, pending = await asyncio.wait(tasks.values(), timeout=settings.timeout_seconds)
+            for task in pending:
+                task.cancel()
+
+        success_count = len(found)
         failure_count = 0
-        
-        for symbol, res in zip(validated, results):
-            try:
-                if isinstance(res, CompanyInfoSchema):
-                    # Direct schema object from _fetch_company_info
-                    stocks.append({symbol: res})
-                    success_count += 1
-                    # Cache the result
-                    result_dict = res.model_dump() if hasattr(res, 'model_dump') else res.__dict__
-                    self._set_cache(self._get_cache_key(symbol, "company_info"), result_dict)
-                elif isinstance(res, dict):
-                    # Cached result - convert to schema
-                    schema = CompanyInfoSchema(**res)
-                    stocks.append({symbol: schema})
-                    success_count += 1
-                elif isinstance(res, Exception):
-                    # Exception occurred
-                    error_schema = CompanyInfoSchema(
-                        symbol=symbol,
-                        name="",
-                        business_summary=f"Error: {str(res)}"
-                    )
-                    stocks.append({symbol: error_schema})
-                    failure_count += 1
-                else:
-                    # Unexpected result type
-                    error_schema = CompanyInfoSchema(
-                        symbol=symbol,
-                        name="",
-                        business_summary=f"Error: Unexpected result type: {type(res)}"
-                    )
-                    stocks.append({symbol: error_schema})
-                    failure_count += 1
-            except Exception as e:
-                # Error processing result
-                error_schema = CompanyInfoSchema(
+        for symbol, task in tasks.items():
+            res = (task.exception() or task.result()) if task in done else TimeoutException()
+            if isinstance(res, CompanyInfoSchema):
+                found[symbol] = res
+                success_count += 1
+                await self._set_cache(self._get_cache_key(symbol, "company_info"), res)
+            else:
+                if isinstance(res, DataNotFoundException):
+                    await self._set_negative(self._get_cache_key(symbol, "company_info"), res)
+                found[symbol] = CompanyInfoSchema(
                     symbol=symbol,
                     name="",
-                    business_summary=f"Error processing result: {str(e)}"
+                    business_summary=f"Error: {str(res)}"
                 )
-                stocks.append({symbol: error_schema})
                 failure_count += 1
-        
+        for symbol, negative in negatives.items():
+            found[symbol] = CompanyInfoSchema(
+                symbol=symbol,
+                name="",
+                business_summary=f"Error: {negative.message}"
+            )
+            failure_count += 1
+
+        stocks = {symbol: found[symbol] for symbol in validated}
+        for symbol, error in invalid.items():
+            stocks[symbol] = CompanyInfoSchema(
+                symbol=str(symbol),
+                name="",
+                business_summary=f"Error: {error.message}"
+            )
+            failure_count += 1
+
         return MultipleInfoResponse(
             stocks=stocks,
             total_stocks=len(symbols),
@@ -262,7 +554,7 @@ class StockService:
         symbol = validate_symbol(symbol)
         cache_key = self._get_cache_key(symbol, "history", period=period.value, interval=interval.value)
         
-        cached_data = self._get_from_cache(cache_key)
+        cached_data = await self._get_from_cache(cache_key, HistoricalDataSchema)
         if cached_data:
             return cached_data
 
@@ -291,22 +583,19 @@ class StockService:
                 raise
 
         try:
-            loop = asyncio.get_event_loop()
-            future = loop.run_in_executor(self.executor, _fetch_history)
-            result = await asyncio.wait_for(future, timeout=settings.timeout_seconds)
-            
-            self._set_cache(cache_key, result)
-            return result
-            
-        except asyncio.TimeoutError:
-            raise TimeoutException()
+            result = await self._run_blocking(_fetch_history)
+        except DataNotFoundException as e:
+            await self._set_negative(cache_key, e)
+            raise
+        await self._set_cache(cache_key, result)
+        return result
 
     async def get_financials(self, symbol: str) -> FinancialsSchema:
         """Get financial statements"""
         symbol = validate_symbol(symbol)
         cache_key = self._get_cache_key(symbol, "financials")
         
-        cached_data = self._get_from_cache(cache_key)
+        cached_data = await self._get_from_cache(cache_key, FinancialsSchema)
         if cached_data:
             return cached_data
 
@@ -317,9 +606,12 @@ class StockService:
                 def safe_df_to_dict(df: pd.DataFrame) -> Optional[Dict[str, Any]]:
                     if df is None or df.empty:
                         return None
+                    # Column-oriented already: one dict per period, NaN mapped to None in one pass
+                    line_items = [str(k) for k in df.index]
+                    values = df.astype(object).where(df.notna(), None)
                     return {
-                        str(index): {str(k): v for k, v in row.items()}
-                        for index, row in df.T.iterrows()
+                        str(col): dict(zip(line_items, values[col].tolist()))
+                        for col in values.columns
                     }
 
                 financials = FinancialsSchema(
@@ -337,16 +629,9 @@ class StockService:
                 raise
 
 
-        try:
-            loop = asyncio.get_event_loop()
-            future = loop.run_in_executor(self.executor, _fetch_financials)
-            result = await asyncio.wait_for(future, timeout=settings.timeout_seconds)
-            
-            self._set_cache(cache_key, result)
-            return result
-            
-        except asyncio.TimeoutError:
-            raise TimeoutException()
+        result = await self._run_blocking(_fetch_financials)
+        await self._set_cache(cache_key, result)
+        return result
 
 
     async def get_dividends(self, symbol: str) -> DividendsSchema:
@@ -354,7 +639,7 @@ class StockService:
         symbol = validate_symbol(symbol)
         cache_key = self._get_cache_key(symbol, "dividends")
         
-        cached_data = self._get_from_cache(cache_key)
+        cached_data = await self._get_from_cache(cache_key, DividendsSchema)
         if cached_data:
             return cached_data
 
@@ -377,23 +662,16 @@ class StockService:
                 logger.error(f"Error fetching dividends for {symbol}: {str(e)}")
                 raise
 
-        try:
-            loop = asyncio.get_event_loop()
-            future = loop.run_in_executor(self.executor, _fetch_dividends)
-            result = await asyncio.wait_for(future, timeout=settings.timeout_seconds)
-            
-            self._set_cache(cache_key, result)
-            return result
-            
-        except asyncio.TimeoutError:
-            raise TimeoutException()
+        result = await self._run_blocking(_fetch_dividends)
+        await self._set_cache(cache_key, result)
+        return result
 
     async def get_splits(self, symbol: str) -> StockSplitSchema:
         """Get stock split data"""
         symbol = validate_symbol(symbol)
         cache_key = self._get_cache_key(symbol, "splits")
         
-        cached_data = self._get_from_cache(cache_key)
+        cached_data = await self._get_from_cache(cache_key, StockSplitSchema)
         if cached_data:
             return cached_data
 
@@ -416,23 +694,16 @@ class StockService:
                 logger.error(f"Error fetching splits for {symbol}: {str(e)}")
                 raise
 
-        try:
-            loop = asyncio.get_event_loop()
-            future = loop.run_in_executor(self.executor, _fetch_splits)
-            result = await asyncio.wait_for(future, timeout=settings.timeout_seconds)
-            
-            self._set_cache(cache_key, result)
-            return result
-            
-        except asyncio.TimeoutError:
-            raise TimeoutException()
+        result = await self._run_blocking(_fetch_splits)
+        await self._set_cache(cache_key, result)
+        return result
 
     async def get_recommendations(self, symbol: str) -> RecommendationSchema:
         """Get analyst recommendations"""
         symbol = validate_symbol(symbol)
         cache_key = self._get_cache_key(symbol, "recommendations")
         
-        cached_data = self._get_from_cache(cache_key)
+        cached_data = await self._get_from_cache(cache_key, RecommendationSchema)
         if cached_data:
             return cached_data
 
@@ -454,161 +725,82 @@ class StockService:
                 logger.error(f"Error fetching recommendations for {symbol}: {str(e)}")
                 raise
 
-        try:
-            loop = asyncio.get_event_loop()
-            future = loop.run_in_executor(self.executor, _fetch_recommendations)
-            result = await asyncio.wait_for(future, timeout=settings.timeout_seconds)
-            
-            self._set_cache(cache_key, result)
-            return result
-            
-        except asyncio.TimeoutError:
-            raise TimeoutException()
+        result = await self._run_blocking(_fetch_recommendations)
+        await self._set_cache(cache_key, result)
+        return result
 
     async def get_market_indices(self) -> Dict[str, Any]:
         """Get market indices data"""
-        
-        def _fetch_index(symbol: str):
-            try:
-                ticker = get_ticker(symbol)
-                info = ticker.info
-                hist = ticker.history(period="2d")
-                
-                if hist.empty:
-                    return None
-                
-                current_price = float(hist['Close'].iloc[-1])
-                previous_close = float(hist['Close'].iloc[-2]) if len(hist) > 1 else current_price
-                change, change_percent = calculate_change(current_price, previous_close)
-                
-                index_name = {
-                    '^GSPC': 'S&P 500',
-                    '^DJI': 'Dow Jones',
-                    '^IXIC': 'NASDAQ'
-                }.get(symbol, symbol)
-                
-                return {
-                    'symbol': symbol,
-                    'name': index_name,
-                    'current_price': format_price(current_price),
-                    'change': change,
-                    'change_percent': change_percent,
-                    'volume': int(hist['Volume'].iloc[-1])
-                }
-                
-            except Exception as e:
-                logger.error(f"Error fetching index {symbol}: {str(e)}")
-                return None
-
-        loop = asyncio.get_event_loop()
-        futures = [
-            loop.run_in_executor(self.executor, _fetch_index, symbol)
-            for symbol in self.market_indices
-        ]
-        
         try:
-            results = await asyncio.gather(*futures, return_exceptions=True)
-            
-            indices = []
-            for result in results:
-                if result and not isinstance(result, Exception):
-                    indices.append(result)
-            
-            return {
-                'market_indices': indices,
-                'total_indices': len(indices)
-            }
-            
+            quotes = await self._get_quotes(list(_INDEX_NAMES))
         except Exception as e:
             logger.error(f"Error in get_market_indices: {str(e)}")
             raise
 
+        indices = []
+        for symbol, index_name in _INDEX_NAMES.items():
+            quote = quotes.get(symbol)
+            if quote is None:
+                continue
+            current_price = float(quote['regularMarketPrice'])
+            previous_close = float(safe_get(quote, 'regularMarketPreviousClose') or current_price)
+            change, change_percent = calculate_change(current_price, previous_close)
+            indices.append({
+                'symbol': symbol,
+                'name': index_name,
+                'current_price': format_price(current_price),
+                'change': change,
+                'change_percent': change_percent,
+                'volume': int(safe_get(quote, 'regularMarketVolume') or 0)
+            })
+
+        return {
+            'market_indices': indices,
+            'total_indices': len(indices)
+        }
+
     async def search_stocks(self, query: str) -> Dict[str, Any]:
         """Search stocks by name or symbol"""
         query_lower = query.lower()
-        
-        # Extended stock database for search
-        stock_database = {
-            'AAPL': 'Apple Inc.',
-            'GOOGL': 'Alphabet Inc.',
-            'MSFT': 'Microsoft Corporation',
-            'AMZN': 'Amazon.com Inc.',
-            'TSLA': 'Tesla Inc.',
-            'META': 'Meta Platforms Inc.',
-            'NVDA': 'NVIDIA Corporation',
-            'NFLX': 'Netflix Inc.',
-            'BABA': 'Alibaba Group Holding Ltd.',
-            'DIS': 'The Walt Disney Company',
-            'PYPL': 'PayPal Holdings Inc.',
-            'ADBE': 'Adobe Inc.',
-            'CRM': 'Salesforce Inc.',
-            'INTC': 'Intel Corporation',
-            'AMD': 'Advanced Micro Devices Inc.',
-            'ORCL': 'Oracle Corporation',
-            'IBM': 'International Business Machines Corporation',
-            'UBER': 'Uber Technologies Inc.',
-            'LYFT': 'Lyft Inc.',
-            'SPOT': 'Spotify Technology S.A.',
-            'TWTR': 'Twitter Inc.',
-            'SNAP': 'Snap Inc.',
-            'ZM': 'Zoom Video Communications Inc.',
-            'SLACK': 'Slack Technologies Inc.',
-            'SQ': 'Square Inc.',
-            'SHOP': 'Shopify Inc.'
-        }
-        
-        results = []
-        
-        for symbol, name in stock_database.items():
-            if (query_lower in symbol.lower() or 
-                query_lower in name.lower() or
-                any(query_lower in word.lower() for word in name.split())):
-                results.append({
-                    'symbol': symbol,
-                    'name': name,
-                    'match_score': self._calculate_match_score(query_lower, symbol, name)
-                })
-        
-        # Sort by match score (descending)
-        results.sort(key=lambda x: x['match_score'], reverse=True)
-        
-        # Remove match_score from final results
-        for result in results:
-            del result['match_score']
-        
+
+        # Any substring of length >= 3 contains the query's first trigram
+        if len(query_lower) >= 3:
+            candidates = sorted(_SEARCH_INDEX.get(query_lower[:3], ()))
+        else:
+            candidates = range(len(_STOCK_DB))
+
+        scored = []
+
+        for i in candidates:
+            _, _, symbol_lower, name_lower, name_words = _STOCK_DB[i]
+            if query_lower in symbol_lower or query_lower in name_lower:
+                scored.append((_calculate_match_score(query_lower, symbol_lower, name_lower, name_words), i))
+
+        # Sort by match score (descending); stable, so ties keep table order
+        scored.sort(key=lambda x: x[0], reverse=True)
+
         return {
-            'search_results': results[:20],  # Limit to top 20 results
-            'total_results': len(results),
+            'search_results': [  # Limit to top 20 results
+                {'symbol': _STOCK_DB[i][0], 'name': _STOCK_DB[i][1]} for _, i in scored[:20]
+            ],
+            'total_results': len(scored),
             'query': query
         }
 
-    def _calculate_match_score(self, query: str, symbol: str, name: str) -> float:
-        """Calculate match score for search results"""
-        score = 0.0
-        
-        # Exact symbol match gets highest score
-        if query == symbol.lower():
-            score += 100
-        elif query in symbol.lower():
-            score += 50
-        
-        # Exact name match
-        if query == name.lower():
-            score += 90
-        elif query in name.lower():
-            score += 30
-        
-        # Word match in name
-        name_words = name.lower().split()
-        for word in name_words:
-            if query in word:
-                score += 20
-            elif word.startswith(query):
-                score += 15
-        
-        return score
-
-    def __del__(self):
-        """Cleanup executor on service destruction"""
-        if hasattr(self, 'executor'):
-            self.executor.shutdown(wait=True)
+    @classmethod
+    def start(cls):
+        """Create the shared executor, concurrency limit and Redis client; safe to call again after shutdown()"""
+        cls.executor = ThreadPoolExecutor(max_workers=settings.max_workers)
+        cls._semaphore = asyncio.Semaphore(settings.max_workers)
+        if settings.redis_url:
+            cls._redis = aioredis.from_url(settings.redis_url, decode_responses=False)
+
+    @classmethod
+    async def shutdown(cls):
+        """Release the shared executor and Redis client without waiting on in-flight calls"""
+        if cls.executor is not None:
+            cls.executor.shutdown(wait=False, cancel_futures=True)
+            cls.executor = None
+        if cls._redis is not None:
+            await cls._redis.aclose()
+            cls._redis = None
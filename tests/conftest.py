@@ -0,0 +1,24 @@
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Modules import each other as top-level packages (config, services, utils)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Settings requires broker credentials; dummy values are enough for unit tests
+for name in ("SECRET_TOTP", "USER", "U_PWD", "VC", "APP_KEY", "IMET", "DHAN_ACCESS_TOKEN", "CLIENT_ID"):
+    os.environ.setdefault(name, "test")
+
+
+@pytest.fixture
+def service():
+    """A StockService with the shared executor started, as the app lifespan does"""
+    # Imported here so the settings above are in place first
+    from services.stock_service import StockService
+
+    StockService.start()
+    yield StockService()
+    asyncio.run(StockService.shutdown())
@@ -0,0 +1,100 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from config.settings import settings
+from services import stock_service
+from utils.exceptions import StockAPIException
+
+RICH_INFO = {
+    "longName": "Apple Inc.",
+    "sector": "Technology",
+    "industry": "Consumer Electronics",
+    "country": "United States",
+    "marketCap": 3_000_000_000_000,
+    "trailingPE": 30.5,
+}
+SPARSE_INFO = {"longName": "Apple Inc."}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    # Patch only the module's view of time so asyncio keeps the real clock
+    monkeypatch.setattr(stock_service, "time", SimpleNamespace(monotonic=fake.monotonic))
+    return fake
+
+
+@pytest.fixture
+def infos(monkeypatch):
+    """Queue of payloads (or exceptions) returned by successive Ticker(...).info reads"""
+    queue = []
+
+    class FakeTicker:
+        def __init__(self, symbol, session=None):
+            pass
+
+        @property
+        def info(self):
+            item = queue.pop(0)
+            if isinstance(item, Exception):
+                raise item
+            return item
+
+    monkeypatch.setattr(stock_service.yf, "Ticker", FakeTicker)
+    return queue
+
+
+def test_sparse_refresh_after_cache_expiry_keeps_richer_info(service, clock, infos):
+    infos.extend([RICH_INFO, SPARSE_INFO])
+
+    first = asyncio.run(service.get_company_info("AAPL"))
+    # The cached entry expires and the next request refetches from Yahoo
+    service.cache.clear()
+    clock.now += settings.cache_timeout + 1
+    second = asyncio.run(service.get_company_info("AAPL"))
+
+    assert first.sector == "Technology"
+    assert second == first
+
+
+def test_failed_refresh_serves_recent_info(service, clock, infos):
+    infos.extend([RICH_INFO, ConnectionError("rate limited")])
+
+    first = asyncio.run(service.get_company_info("AAPL"))
+    service.cache.clear()
+    clock.now += settings.cache_timeout + 1
+
+    assert asyncio.run(service.get_company_info("AAPL")) == first
+
+
+def test_failed_refresh_past_retention_raises(service, clock, infos):
+    infos.extend([RICH_INFO, ConnectionError("rate limited")])
+
+    asyncio.run(service.get_company_info("AAPL"))
+    service.cache.clear()
+    clock.now += settings.info_retention_seconds + 1
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(service.get_company_info("AAPL"))
+
+
+def test_empty_refresh_past_retention_is_not_found(service, clock, infos):
+    infos.extend([RICH_INFO, {}])
+
+    asyncio.run(service.get_company_info("AAPL"))
+    service.cache.clear()
+    clock.now += settings.info_retention_seconds + 1
+
+    with pytest.raises(StockAPIException) as excinfo:
+        asyncio.run(service.get_company_info("AAPL"))
+    assert excinfo.value.status_code == 404
@@ -0,0 +1,90 @@
+import random
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import yfinance.data
+
+from utils import helpers
+from utils.helpers import calculate_change, calculate_changes, df_to_dict, fetch_quotes
+
+
+def _history():
+    index = pd.DatetimeIndex(
+        ["2024-01-02 09:30", "2024-01-03 09:30"], name="Date"
+    ).tz_localize("America/New_York")
+    return pd.DataFrame({"Close": [185.64, 184.25], "Volume": [82_488_700, 58_414_500]}, index=index)
+
+
+def test_df_to_dict_emits_utc_epoch_millis():
+    rows = df_to_dict(_history())
+
+    assert rows == [
+        {"Date": 1_704_205_800_000, "Close": 185.64, "Volume": 82_488_700},
+        {"Date": 1_704_292_200_000, "Close": 184.25, "Volume": 58_414_500},
+    ]
+    assert all(type(row["Date"]) is int for row in rows)
+
+
+def test_df_to_dict_local_strings_when_requested():
+    rows = df_to_dict(_history(), epoch_timestamps=False)
+
+    assert [row["Date"] for row in rows] == ["2024-01-02 09:30:00", "2024-01-03 09:30:00"]
+
+
+def test_df_to_dict_maps_nat_to_none():
+    df = pd.DataFrame({"Date": pd.to_datetime(["2024-01-02", None]), "Value": [1, 2]})
+
+    assert [row["Date"] for row in df_to_dict(df.set_index("Date"))] == [1_704_153_600_000, None]
+
+
+def test_df_to_dict_maps_pandas_na_to_none():
+    df = pd.DataFrame({"Shares": pd.array([10, None], dtype="Int64"), "Note": ["a", pd.NA]})
+
+    assert df_to_dict(df) == [
+        {"index": 0, "Shares": 10, "Note": "a"},
+        {"index": 1, "Shares": None, "Note": None},
+    ]
+
+
+def test_calculate_changes_matches_scalar():
+    rng = random.Random(0)
+    pairs = [(187.345, 185.115), (0.125, 0.1), (10.0, 0.0), (1.005, 1.0), (2.675, 0.0001)]
+    pairs += [(round(rng.uniform(0, 500), 3), round(rng.uniform(0, 500), 3)) for _ in range(2_000)]
+    current = np.array([c for c, _ in pairs], dtype=float)
+    previous = np.array([p for _, p in pairs], dtype=float)
+
+    changes, change_percents = calculate_changes(current, previous)
+
+    assert list(zip(changes, change_percents)) == [calculate_change(c, p) for c, p in pairs]
+
+
+def test_fetch_quotes_falls_back_to_fast_info(monkeypatch):
+    class ChangedYfData:
+        def __init__(self, session=None):
+            pass
+
+        def get_raw_json(self, url, params=None, timeout=30):
+            return {"finance": {"result": None, "error": {"code": "Not Found"}}}
+
+    fast_infos = {
+        "AAPL": SimpleNamespace(
+            last_price=190.0, regular_market_previous_close=185.0, last_volume=1_000,
+            market_cap=3e12, day_high=191.0, day_low=184.0, year_high=199.6, year_low=float("nan"),
+        ),
+        "NOPE": SimpleNamespace(
+            last_price=float("nan"), regular_market_previous_close=None, last_volume=None,
+            market_cap=None, day_high=None, day_low=None, year_high=None, year_low=None,
+        ),
+    }
+    monkeypatch.setattr(yfinance.data, "YfData", ChangedYfData)
+    monkeypatch.setattr(
+        helpers.yf, "Ticker", lambda symbol, session=None: SimpleNamespace(fast_info=fast_infos[symbol])
+    )
+
+    quotes = fetch_quotes(["AAPL", "NOPE"])
+
+    assert list(quotes) == ["AAPL"]
+    assert quotes["AAPL"]["regularMarketPrice"] == 190.0
+    assert quotes["AAPL"]["regularMarketPreviousClose"] == 185.0
+    assert quotes["AAPL"]["fiftyTwoWeekLow"] is None
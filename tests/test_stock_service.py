@@ -0,0 +1,219 @@
+import asyncio
+import math
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from config.settings import settings
+from services import stock_service
+from services.stock_service import _STOCK_NAMES
+
+
+def _quote(symbol, price, previous, market_cap=None):
+    return {
+        "symbol": symbol,
+        "regularMarketPrice": price,
+        "regularMarketPreviousClose": previous,
+        "regularMarketVolume": 1_000,
+        "marketCap": market_cap,
+        "longName": f"{symbol} Inc.",
+    }
+
+
+@pytest.fixture
+def quotes(monkeypatch):
+    """Canned Yahoo quotes served by a stub fetch_quotes that records each batch"""
+    available = {}
+    batches = []
+
+    def fake_fetch_quotes(symbols):
+        batches.append(list(symbols))
+        return {symbol: available[symbol] for symbol in symbols if symbol in available}
+
+    monkeypatch.setattr(stock_service, "fetch_quotes", fake_fetch_quotes)
+    return SimpleNamespace(available=available, batches=batches)
+
+
+# --- search -----------------------------------------------------------------
+
+def _old_match_score(query, symbol, name):
+    score = 0.0
+    if query == symbol.lower():
+        score += 100
+    elif query in symbol.lower():
+        score += 50
+    if query == name.lower():
+        score += 90
+    elif query in name.lower():
+        score += 30
+    for word in name.lower().split():
+        if query in word:
+            score += 20
+        elif word.startswith(query):
+            score += 15
+    return score
+
+
+def _old_search(query):
+    """The linear substring scan search_stocks replaced"""
+    query_lower = query.lower()
+    results = []
+    for symbol, name in _STOCK_NAMES.items():
+        if (query_lower in symbol.lower() or
+            query_lower in name.lower() or
+            any(query_lower in word.lower() for word in name.split())):
+            results.append({'symbol': symbol, 'name': name,
+                            'match_score': _old_match_score(query_lower, symbol, name)})
+    results.sort(key=lambda x: x['match_score'], reverse=True)
+    for result in results:
+        del result['match_score']
+    return {'search_results': results[:20], 'total_results': len(results), 'query': query}
+
+
+@pytest.mark.parametrize("query", [
+    "", "a", "IN", "inc", "Inc.", "app", "AAPL", "corp", "micro", "s.a.", "walt disney",
+    "zoom video", "tion", "xyz", " ", "sq", "technologies inc",
+])
+def test_search_matches_substring_scan(service, query):
+    assert asyncio.run(service.search_stocks(query)) == _old_search(query)
+
+
+# --- batched quotes ---------------------------------------------------------
+
+def test_multiple_stocks_skip_invalid_and_missing_symbols(service, quotes):
+    quotes.available.update({
+        "MSFT": _quote("MSFT", 410.0, 400.0),
+        "AAPL": _quote("AAPL", 190.0, 200.0),
+        "GOOGL": _quote("GOOGL", 150.0, 150.0),
+    })
+
+    result = asyncio.run(service.get_multiple_stocks(["msft", "bad sym!", "NOPE", "AAPL", "GOOGL"]))
+
+    # No market caps, so the stable sort leaves the input order intact
+    assert [stock["symbol"] for stock in result["trending_stocks"]] == ["MSFT", "AAPL", "GOOGL"]
+    assert result["total_stocks"] == 3
+    msft = result["trending_stocks"][0]
+    assert (msft["current_price"], msft["change"], msft["change_percent"]) == (410.0, 10.0, 2.5)
+
+
+def test_multiple_stocks_order_by_market_cap_and_limit(service, quotes):
+    quotes.available.update({
+        "AAA": _quote("AAA", 10.0, 10.0, market_cap=1),
+        "BBB": _quote("BBB", 10.0, 10.0, market_cap=3),
+        "CCC": _quote("CCC", 10.0, 10.0, market_cap=2),
+    })
+
+    result = asyncio.run(service.get_multiple_stocks(["AAA", "BBB", "CCC"], limit=2))
+
+    assert [stock["symbol"] for stock in result["trending_stocks"]] == ["BBB", "CCC"]
+
+
+def test_quotes_are_fetched_in_batches_and_cached(service, quotes, monkeypatch):
+    monkeypatch.setattr(stock_service, "QUOTE_BATCH_SIZE", 2)
+    for symbol in ("AAA", "BBB", "CCC"):
+        quotes.available[symbol] = _quote(symbol, 10.0, 10.0)
+
+    asyncio.run(service.get_multiple_stocks(["AAA", "BBB", "CCC", "NOPE"]))
+    asyncio.run(service.get_multiple_stocks(["AAA", "BBB", "CCC", "NOPE"]))
+
+    # The second call is served from the quote cache, including the negative entry for NOPE
+    assert quotes.batches == [["AAA", "BBB"], ["CCC", "NOPE"]]
+
+
+def test_price_and_multiple_stocks_agree(service, quotes):
+    quotes.available["AAPL"] = _quote("AAPL", 187.345, 185.115)
+
+    price = asyncio.run(service.get_stock_price("AAPL"))
+    stock = asyncio.run(service.get_multiple_stocks(["AAPL"]))["trending_stocks"][0]
+
+    assert (price.change, price.change_percent) == (stock["change"], stock["change_percent"])
+
+
+# --- company info batches ---------------------------------------------------
+
+@pytest.fixture
+def tickers(monkeypatch):
+    """Per-symbol info payloads; a number instead of a dict makes that symbol sleep that long"""
+    infos = {}
+
+    class FakeTicker:
+        def __init__(self, symbol, session=None):
+            self.symbol = symbol
+
+        @property
+        def info(self):
+            payload = infos.get(self.symbol, {})
+            if isinstance(payload, (int, float)):
+                time.sleep(payload)
+                return {"longName": self.symbol}
+            return payload
+
+    monkeypatch.setattr(stock_service.yf, "Ticker", FakeTicker)
+    return infos
+
+
+def test_multiple_company_info_keeps_input_order(service, tickers):
+    tickers.update({"MSFT": {"longName": "Microsoft"}, "AAPL": {"longName": "Apple"}})
+
+    result = asyncio.run(service.get_multiple_company_info(["msft", "NOPE", "AAPL", "bad sym!"]))
+
+    assert list(result.stocks) == ["MSFT", "NOPE", "AAPL", "bad sym!"]
+    assert result.stocks["MSFT"].name == "Microsoft"
+    assert result.stocks["NOPE"].business_summary.startswith("Error:")
+    assert result.stocks["bad sym!"].business_summary.startswith("Error:")
+    assert (result.successful_requests, result.failed_requests) == (2, 2)
+
+
+def test_multiple_company_info_reports_symbols_past_the_deadline(service, tickers, monkeypatch):
+    monkeypatch.setattr(settings, "timeout_seconds", 0.2)
+    tickers.update({"FAST": {"longName": "Fast"}, "SLOW": 1.0})
+
+    result = asyncio.run(service.get_multiple_company_info(["FAST", "SLOW"]))
+
+    assert result.stocks["FAST"].name == "Fast"
+    assert result.stocks["SLOW"].business_summary.startswith("Error: Request timeout")
+    assert (result.successful_requests, result.failed_requests) == (1, 1)
+
+
+# --- financial statements ---------------------------------------------------
+
+def _old_safe_df_to_dict(df):
+    """The transpose-based builder get_financials used before"""
+    if df is None or df.empty:
+        return None
+    return {
+        str(index): {str(k): v for k, v in row.items()}
+        for index, row in df.T.iterrows()
+    }
+
+
+def _nan_to_none(statement):
+    return {
+        period: {k: None if isinstance(v, float) and math.isnan(v) else v for k, v in row.items()}
+        for period, row in statement.items()
+    }
+
+
+def test_financial_statements_match_transpose_builder(service, monkeypatch):
+    statement = pd.DataFrame(
+        {
+            pd.Timestamp("2024-12-31"): [391_035_000_000.0, np.nan, 93_736_000_000.0],
+            pd.Timestamp("2023-12-31"): [383_285_000_000.0, 1.5, np.nan],
+        },
+        index=["Total Revenue", "Diluted EPS", "Net Income"],
+    )
+    ticker = SimpleNamespace(
+        quarterly_financials=statement, financials=statement.iloc[:, :1],
+        balance_sheet=pd.DataFrame(), cashflow=statement,
+    )
+    monkeypatch.setattr(stock_service, "get_ticker", lambda symbol: ticker)
+
+    result = asyncio.run(service.get_financials("AAPL"))
+
+    assert result.quarterly_financials == _nan_to_none(_old_safe_df_to_dict(statement))
+    assert result.yearly_financials == _nan_to_none(_old_safe_df_to_dict(statement.iloc[:, :1]))
+    assert result.balance_sheet is None
+    assert list(result.cash_flow) == ["2024-12-31 00:00:00", "2023-12-31 00:00:00"]
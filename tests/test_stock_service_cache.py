@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+from services.stock_service import StockService, _NegativeEntry
+from utils.exceptions import DataNotFoundException, StockAPIException
+
+
+class FakeRedis:
+    """Just enough of redis.asyncio.Redis for the cache helpers"""
+
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def mget(self, keys):
+        return [self.store.get(key) for key in keys]
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value.encode() if isinstance(value, str) else value
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(StockService, "_redis", fake)
+    return fake
+
+
+def test_negative_entry_round_trips_through_redis(redis):
+    service = StockService()
+    key = service._get_cache_key("NOPE", "quote")
+
+    asyncio.run(service._set_negative(key, DataNotFoundException("NOPE", "price")))
+
+    with pytest.raises(StockAPIException) as excinfo:
+        asyncio.run(service._get_from_cache(key))
+    assert excinfo.value.status_code == 404
+    assert excinfo.value.error_code == "DATA_NOT_FOUND"
+
+
+def test_mget_returns_negative_entries_alongside_hits(redis):
+    service = StockService()
+    hit_key = service._get_cache_key("AAPL", "quote")
+    miss_key = service._get_cache_key("NOPE", "quote")
+
+    async def scenario():
+        await service._set_cache(hit_key, {"regularMarketPrice": 1.0})
+        await service._set_negative(miss_key, DataNotFoundException("NOPE", "price"))
+        return await service._get_many_from_cache([hit_key, miss_key])
+
+    hit, miss = asyncio.run(scenario())
+    assert hit == {"regularMarketPrice": 1.0}
+    assert isinstance(miss, _NegativeEntry)
+    assert miss.status_code == 404
@@ -0,0 +1,33 @@
+import asyncio
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Hashable
+
+from cachetools import TTLCache
+
+from config.settings import settings
+
+# Same lifetime as the underlying price cache, so the two don't stack into
+# twice the staleness
+_response_cache = TTLCache(maxsize=16, ttl=settings.price_cache_ttl)
+_locks = defaultdict(asyncio.Lock)
+
+def _is_cacheable(value: Any) -> bool:
+    """Skip degraded batch responses where every upstream lookup failed"""
+    return not (isinstance(value, dict) and value.get('successful_requests', 1) == 0)
+
+async def cached(key: Hashable, coro_fn: Callable[[], Awaitable[Any]]) -> Any:
+    """Return the cached result for key, awaiting coro_fn at most once per TTL.
+
+    Concurrent callers on a cold key wait on the same lock, so only one
+    upstream request is made. Responses with zero successful lookups are
+    returned but not cached.
+    """
+    if key in _response_cache:
+        return _response_cache[key]
+    async with _locks[key]:
+        if key in _response_cache:
+            return _response_cache[key]
+        value = await coro_fn()
+        if _is_cacheable(value):
+            _response_cache[key] = value
+        return value
@@ -1,45 +1,155 @@
+import math
+import re
+import time
+from functools import lru_cache
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import yfinance as yf
+from curl_cffi import requests as curl_requests
+from yfinance.exceptions import YFRateLimitError
 from utils.exceptions import InvalidSymbolException, DataNotFoundException
 import logging
 
 logger = logging.getLogger(__name__)
 
-def get_ticker(symbol: str) -> yf.Ticker:
-    """Get yfinance ticker object with error handling"""
+_SPLIT_RE = re.compile(r'[,\s]+')
+# Tickers, indices (^GSPC), exchange suffixes (BAJAJ-AUTO.NS, M&M.NS) and FX/futures (EURUSD=X)
+_SYMBOL_RE = re.compile(r'[A-Z0-9.\-^=&]{1,20}')
+_ts_cache = [0, ""]
+
+# One HTTP session for every yfinance call so connections are kept alive
+# between tickers. Recent yfinance only accepts curl_cffi sessions.
+yf_session = curl_requests.Session(impersonate="chrome")
+
+_QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
+# v7 quote key -> Ticker.fast_info attribute, for the per-ticker fallback
+_FAST_INFO_FIELDS = {
+    'regularMarketPrice': 'last_price',
+    'regularMarketPreviousClose': 'regular_market_previous_close',
+    'regularMarketVolume': 'last_volume',
+    'marketCap': 'market_cap',
+    'regularMarketDayHigh': 'day_high',
+    'regularMarketDayLow': 'day_low',
+    'fiftyTwoWeekHigh': 'year_high',
+    'fiftyTwoWeekLow': 'year_low',
+}
+
+def _ticker_quote(symbol: str) -> Optional[Dict[str, Any]]:
+    """Build a v7-style quote from Ticker.fast_info, or None when Yahoo has no price"""
+    try:
+        fast_info = yf.Ticker(symbol, session=yf_session).fast_info
+        quote = {key: getattr(fast_info, attr) for key, attr in _FAST_INFO_FIELDS.items()}
+    except YFRateLimitError:
+        raise
+    except Exception as e:
+        logger.warning(f"fast_info lookup failed for {symbol}: {str(e)}")
+        return None
+    quote = {
+        key: None if isinstance(value, float) and math.isnan(value) else value
+        for key, value in quote.items()
+    }
+    if quote['regularMarketPrice'] is None:
+        return None
+    quote['symbol'] = symbol
+    return quote
+
+def fetch_quotes(symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Fetch raw Yahoo quotes for several symbols in one request, keyed by symbol.
+
+    Goes through yfinance's private YfData so the shared session carries the
+    cookie/crumb pair Yahoo requires on the quote endpoint. If that module
+    moves or the request fails or returns an unexpected shape (anything but a
+    rate limit), each symbol is fetched through Ticker.fast_info instead,
+    which is slower and has no names or sectors.
+    """
+    if not symbols:
+        return {}
     try:
-        ticker = yf.Ticker(symbol)
-        # Test if ticker is valid by trying to get info
-        info = ticker.info
-        if not info or info.get('symbol') is None:
-            raise InvalidSymbolException(symbol)
-        return ticker
+        from yfinance.data import YfData
+
+        payload = YfData(session=yf_session).get_raw_json(
+            _QUOTE_URL, params={"symbols": ",".join(symbols), "formatted": "false"}
+        )
+        results = payload["quoteResponse"]["result"]
+        return {quote["symbol"]: quote for quote in results if quote.get("symbol")}
+    except YFRateLimitError:
+        raise
     except Exception as e:
-        logger.error(f"Error getting ticker for {symbol}: {str(e)}")
+        logger.warning(f"Batch quote request failed, fetching {len(symbols)} symbols one by one: {str(e)}")
+    quotes = {}
+    for symbol in symbols:
+        quote = _ticker_quote(symbol)
+        if quote is not None:
+            quotes[symbol] = quote
+    return quotes
+
+def get_ticker(symbol: str) -> yf.Ticker:
+    """Get yfinance ticker object for a well-formed symbol.
+
+    Only the symbol's shape is checked here; unknown symbols surface as
+    empty data from the call that actually uses the ticker.
+    """
+    if not isinstance(symbol, str) or not _SYMBOL_RE.fullmatch(symbol):
         raise InvalidSymbolException(symbol)
+    return yf.Ticker(symbol, session=yf_session)
+
+def _datetime_strings(values: np.ndarray) -> np.ndarray:
+    """Format a datetime64 array as 'YYYY-MM-DD HH:MM:SS' strings, NaT as None"""
+    strings = np.char.replace(np.datetime_as_string(values, unit='s'), 'T', ' ').astype(object)
+    strings[np.isnat(values)] = None
+    return strings
+
+def _epoch_millis(values: np.ndarray) -> np.ndarray:
+    """Turn a datetime64[ms] array into epoch-millisecond ints, NaT as None"""
+    millis = values.view('int64').astype(object)
+    millis[np.isnat(values)] = None
+    return millis
+
+def df_to_dict(df: pd.DataFrame, epoch_timestamps: bool = True) -> List[Dict[str, Any]]:
+    """Convert DataFrame to list of dictionaries.
 
-def df_to_dict(df: pd.DataFrame) -> List[Dict[str, Any]]:
-    """Convert DataFrame to list of dictionaries"""
+    Datetime columns become UTC epoch milliseconds, or local
+    'YYYY-MM-DD HH:MM:SS' strings when epoch_timestamps is False.
+    """
     if df.empty:
         return []
     try:
         df_reset = df.reset_index()
-        # Convert timestamps to strings for JSON serialization
+        # Build each column once as a plain list, converting timestamps in bulk
+        arrays = []
         for col in df_reset.columns:
-            if df_reset[col].dtype == 'datetime64[ns]':
-                df_reset[col] = df_reset[col].dt.strftime('%Y-%m-%d %H:%M:%S')
-        return df_reset.to_dict('records')
+            series = df_reset[col]
+            if isinstance(series.dtype, pd.DatetimeTZDtype):
+                series = series.dt.tz_convert(None) if epoch_timestamps else series.dt.tz_localize(None)
+            if pd.api.types.is_datetime64_any_dtype(series.dtype):
+                values = series.to_numpy(dtype='datetime64[ms]')
+                arrays.append(_epoch_millis(values) if epoch_timestamps else _datetime_strings(values))
+            elif series.dtype == object or pd.api.types.is_extension_array_dtype(series.dtype):
+                # Nullable and object columns can hold pd.NA, which JSON encoders reject
+                arrays.append(series.to_numpy(dtype=object, na_value=None).tolist())
+            else:
+                arrays.append(series.to_numpy().tolist())
+        columns = list(df_reset.columns)
+        return [dict(zip(columns, row)) for row in zip(*arrays)]
     except Exception as e:
         logger.error(f"Error converting DataFrame to dict: {str(e)}")
         return []
 
+@lru_cache(maxsize=4096)
 def validate_symbol(symbol: str) -> str:
     """Validate and normalize stock symbol"""
     if not symbol or not isinstance(symbol, str):
         raise InvalidSymbolException(symbol)
-    return symbol.strip().upper()
+    normalized = symbol.strip().upper()
+    if not _SYMBOL_RE.fullmatch(normalized):
+        raise InvalidSymbolException(symbol)
+    return normalized
+
+def split_symbols(symbols: str) -> List[str]:
+    """Split a comma/whitespace separated symbol string, dropping empty entries"""
+    return list(filter(None, _SPLIT_RE.split(symbols)))
 
 def safe_get(dictionary: Dict, key: str, default: Any = None) -> Any:
     """Safely get value from dictionary"""
@@ -57,6 +167,13 @@ def format_price(price: Optional[float]) -> Optional[float]:
     except (ValueError, TypeError):
         return None
 
+def now_iso() -> str:
+    """Current local time as ISO string, formatted at most once per second"""
+    s = int(time.time())
+    if s != _ts_cache[0]:
+        _ts_cache[:] = [s, datetime.fromtimestamp(s).isoformat()]
+    return _ts_cache[1]
+
 def calculate_change(current: float, previous: float) -> tuple:
     """Calculate price change and percentage change"""
     if previous == 0:
@@ -67,8 +184,17 @@ def calculate_change(current: float, previous: float) -> tuple:
     
     return round(change, 2), round(change_percent, 2)
 
+def calculate_changes(current: np.ndarray, previous: np.ndarray) -> Tuple[List[float], List[float]]:
+    """Vectorized calculate_change for many quotes at once.
+
+    Rounds with Python's round like calculate_change, so both report the same cents.
+    """
+    valid = previous != 0
+    change = np.where(valid, current - previous, 0.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        change_percent = np.where(valid, change / previous * 100, 0.0)
+    return [round(value, 2) for value in change.tolist()], [round(value, 2) for value in change_percent.tolist()]
 
-import re
 
 def prevalidate_credentials(username, password):
     if not username or not password: